@@ -9,6 +9,8 @@ and prints a comparison table covering:
   since they produce no compilable code)
 """
 
+import functools
+import io
 import json
 import sys
 from pathlib import Path
@@ -73,72 +75,79 @@ def main():
     llm_avg_size = avg_cluster_size(llm.get("per_class", [])) if llm else 0.0
 
     # --- Print comparison table ---
-    print("=" * 72)
-    print("GenEC vs Baselines — Comparison Summary")
-    print("=" * 72)
-    print(f"{'':30s} {'GenEC':>10s} {'FieldShare':>10s} {'Random':>10s}", end="")
+    # Collect the report in memory and write it once, instead of one
+    # write (and possible flush) per print() call.
+    buf = io.StringIO()
+    emit = functools.partial(print, file=buf)
+
+    emit("=" * 72)
+    emit("GenEC vs Baselines — Comparison Summary")
+    emit("=" * 72)
+    emit(f"{'':30s} {'GenEC':>10s} {'FieldShare':>10s} {'Random':>10s}", end="")
     if llm:
-        print(f" {'LLM-Only':>10s}", end="")
-    print()
-    print("-" * 72)
+        emit(f" {'LLM-Only':>10s}", end="")
+    emit()
+    emit("-" * 72)
 
-    print(f"{'Classes evaluated':30s} {genec_classes:>10d} {fs.get('total_classes', 0):>10d} {rand.get('total_classes', 0):>10d}", end="")
+    emit(f"{'Classes evaluated':30s} {genec_classes:>10d} {fs.get('total_classes', 0):>10d} {rand.get('total_classes', 0):>10d}", end="")
     if llm:
-        print(f" {llm.get('total_classes', 0):>10d}", end="")
-    print()
+        emit(f" {llm.get('total_classes', 0):>10d}", end="")
+    emit()
 
-    print(f"{'Total suggestions':30s} {genec_suggestions:>10d} {fs_suggestions:>10d} {rand_suggestions:>10d}", end="")
+    emit(f"{'Total suggestions':30s} {genec_suggestions:>10d} {fs_suggestions:>10d} {rand_suggestions:>10d}", end="")
     if llm:
-        print(f" {llm_suggestions:>10d}", end="")
-    print()
+        emit(f" {llm_suggestions:>10d}", end="")
+    emit()
 
-    print(f"{'Avg members/suggestion':30s} {genec_avg_size:>10.1f} {fs_avg_size:>10.1f} {rand_avg_size:>10.1f}", end="")
+    emit(f"{'Avg members/suggestion':30s} {genec_avg_size:>10.1f} {fs_avg_size:>10.1f} {rand_avg_size:>10.1f}", end="")
     if llm:
-        print(f" {llm_avg_size:>10.1f}", end="")
-    print()
+        emit(f" {llm_avg_size:>10.1f}", end="")
+    emit()
 
-    print(f"{'Verified suggestions':30s} {genec_verified:>10d} {'N/A':>10s} {'N/A':>10s}", end="")
+    emit(f"{'Verified suggestions':30s} {genec_verified:>10d} {'N/A':>10s} {'N/A':>10s}", end="")
     if llm:
-        print(f" {'N/A':>10s}", end="")
-    print()
+        emit(f" {'N/A':>10s}", end="")
+    emit()
 
-    print(f"{'Verification rate':30s} {genec_rate:>9.1f}% {'0.0%':>10s} {'0.0%':>10s}", end="")
+    emit(f"{'Verification rate':30s} {genec_rate:>9.1f}% {'0.0%':>10s} {'0.0%':>10s}", end="")
     if llm:
-        print(f" {'0.0%':>10s}", end="")
-    print()
+        emit(f" {'0.0%':>10s}", end="")
+    emit()
 
-    print("-" * 72)
-    print()
+    emit("-" * 72)
+    emit()
 
     # --- Delta analysis ---
-    print("Delta Analysis:")
+    emit("Delta Analysis:")
     fs_delta = genec_suggestions - fs_suggestions
     sign = "+" if fs_delta >= 0 else ""
-    print(f"  GenEC vs Field-Sharing: {sign}{fs_delta} suggestions "
-          f"({genec_suggestions} vs {fs_suggestions})")
-    print(f"  GenEC avg cluster size: {genec_avg_size} members vs "
-          f"Field-Sharing: {fs_avg_size} members")
-    print()
+    emit(f"  GenEC vs Field-Sharing: {sign}{fs_delta} suggestions "
+         f"({genec_suggestions} vs {fs_suggestions})")
+    emit(f"  GenEC avg cluster size: {genec_avg_size} members vs "
+         f"Field-Sharing: {fs_avg_size} members")
+    emit()
 
     rand_delta = genec_suggestions - rand_suggestions
     sign = "+" if rand_delta >= 0 else ""
-    print(f"  GenEC vs Random: {sign}{rand_delta} suggestions "
-          f"({genec_suggestions} vs {rand_suggestions})")
-    print(f"  Random produces many small partitions with 0% verification "
-          f"(no compilation check).")
-    print(f"  GenEC verification rate: {genec_rate}% vs Random: 0.0%")
-    print()
+    emit(f"  GenEC vs Random: {sign}{rand_delta} suggestions "
+         f"({genec_suggestions} vs {rand_suggestions})")
+    emit(f"  Random produces many small partitions with 0% verification "
+         f"(no compilation check).")
+    emit(f"  GenEC verification rate: {genec_rate}% vs Random: 0.0%")
+    emit()
 
     if llm:
         llm_delta = genec_suggestions - llm_suggestions
         sign = "+" if llm_delta >= 0 else ""
-        print(f"  GenEC vs LLM-Only: {sign}{llm_delta} suggestions "
-              f"({genec_suggestions} vs {llm_suggestions})")
-        print(f"  LLM-Only avg cluster size: {llm_avg_size} members")
-        print()
+        emit(f"  GenEC vs LLM-Only: {sign}{llm_delta} suggestions "
+             f"({genec_suggestions} vs {llm_suggestions})")
+        emit(f"  LLM-Only avg cluster size: {llm_avg_size} members")
+        emit()
 
-    print("Note: Baselines do not produce compilable code and have no")
-    print("verification pipeline. Verification rate is 0% by construction.")
+    emit("Note: Baselines do not produce compilable code and have no")
+    emit("verification pipeline. Verification rate is 0% by construction.")
+
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
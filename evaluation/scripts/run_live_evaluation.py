@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Run GenEC live evaluation on real God Classes from cloned repos."""
 
+import functools
 import json
 import logging
 import os
@@ -96,12 +97,19 @@ BENCHMARK = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
+def _analyzer():
+    """Return a shared DependencyAnalyzer (JavaParser init probes for the JDT jar)."""
+    from genec.core.dependency_analyzer import DependencyAnalyzer
+
+    return DependencyAnalyzer()
+
+
 def _compute_suggestion_post_metrics(suggestion) -> dict:
     """Compute post-refactoring LCOM5/TCC for a single suggestion's modified original."""
     if not suggestion.modified_original_code:
         return {}
     try:
-        from genec.core.dependency_analyzer import DependencyAnalyzer
         from genec.metrics.cohesion_calculator import CohesionCalculator
 
         with tempfile.NamedTemporaryFile(suffix=".java", mode="w", delete=False) as f:
@@ -109,8 +117,7 @@ def _compute_suggestion_post_metrics(suggestion) -> dict:
             temp_file = f.name
 
         try:
-            analyzer = DependencyAnalyzer()
-            modified_deps = analyzer.analyze_class(temp_file)
+            modified_deps = _analyzer().analyze_class(temp_file)
             if modified_deps:
                 calc = CohesionCalculator()
                 post_metrics = calc.calculate_cohesion_metrics(modified_deps)
@@ -225,7 +232,6 @@ def run_single_class(entry: dict) -> dict:
         # LCOM5/TCC on the original class minus those methods.
         if result.verified_suggestions:
             try:
-                from genec.core.dependency_analyzer import DependencyAnalyzer
                 from genec.metrics.cohesion_calculator import CohesionCalculator
 
                 # Single-suggestion metrics (last verified, as before)
@@ -238,8 +244,7 @@ def run_single_class(entry: dict) -> dict:
                         temp_file = f.name
 
                     try:
-                        analyzer = DependencyAnalyzer()
-                        modified_deps = analyzer.analyze_class(temp_file)
+                        modified_deps = _analyzer().analyze_class(temp_file)
                         if modified_deps:
                             calc = CohesionCalculator()
                             post_metrics = calc.calculate_cohesion_metrics(modified_deps)
@@ -262,9 +267,8 @@ def run_single_class(entry: dict) -> dict:
                 # Parse original class to get full dependency info
                 original_deps = None
                 try:
-                    orig_analyzer = DependencyAnalyzer()
                     original_path = str(Path(entry["repo_path"]) / entry["class_file"])
-                    original_deps = orig_analyzer.analyze_class(original_path)
+                    original_deps = _analyzer().analyze_class(original_path)
                 except Exception:
                     pass
 
@@ -2,9 +2,22 @@
 GenEC: Generative Extract Class Refactoring Framework
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from genec.core.pipeline import GenECPipeline
+
 __version__ = "1.0.0"
 __author__ = "GenEC Team"
 
-from genec.core.pipeline import GenECPipeline
-
 __all__ = ["GenECPipeline"]
+
+
+def __getattr__(name: str):
+    # Import the pipeline on first access so that `import genec` (and the
+    # CLI's --help/--version paths) do not pull in the LLM/graph stack.
+    if name == "GenECPipeline":
+        from genec.core.pipeline import GenECPipeline
+
+        return GenECPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
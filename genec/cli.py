@@ -1,27 +1,48 @@
 import argparse
+import functools
+import io
 import json
 import logging
 import os
+import signal
 import sys
+import time
 from pathlib import Path
 
 from genec import __version__
-from genec.core.pipeline import GenECPipeline
 from genec.utils.logging_utils import get_logger, setup_logger
 
 logger = get_logger(__name__)
 
 
+def _resolved_path(value: str) -> Path:
+    """argparse type: resolve a path argument once, at parse time.
+
+    Existence is deliberately not checked here. An argparse error would exit
+    with a usage message, whereas ``--json`` callers (the VS Code extension)
+    expect a JSON error payload, which ``_validate_inputs`` provides.
+    """
+    return Path(os.path.realpath(value))
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and return the argument parser."""
     parser = argparse.ArgumentParser(
         description="GenEC: Generative Extract Class Refactoring Tool"
     )
     parser.add_argument("--version", action="version", version=f"GenEC {__version__}")
-    parser.add_argument("--target", required=True, help="Path to the Java class file to refactor")
-    parser.add_argument("--repo", required=True, help="Path to the repository root")
+    parser.add_argument(
+        "--target",
+        required=True,
+        type=_resolved_path,
+        help="Path to the Java class file to refactor",
+    )
+    parser.add_argument(
+        "--repo", required=True, type=_resolved_path, help="Path to the repository root"
+    )
     parser.add_argument(
         "--config",
+        type=_resolved_path,
         default="config/config.yaml",
         help="Path to configuration file (default: config/config.yaml)",
     )
@@ -41,6 +62,11 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--verbose", action="store_true", help="Enable verbose logging (DEBUG level)"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors (ignored with --verbose)",
+    )
     parser.add_argument(
         "--apply-all", action="store_true", help="Automatically apply all verified refactorings"
     )
@@ -92,7 +118,17 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def validate_target_file(file_path: str) -> Path:
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Return a shared parser, built on first use.
+
+    Parsing does not mutate the parser, so repeated ``main()`` calls in one
+    interpreter (tests, embedding callers) can reuse it.
+    """
+    return create_parser()
+
+
+def validate_target_file(file_path: str | Path) -> Path:
     """
     Validate that the target file exists and is a Java file.
 
@@ -103,13 +139,21 @@ def validate_target_file(file_path: str) -> Path:
         Resolved Path object
 
     Raises:
-        FileNotFoundError: If file doesn't exist
+        FileNotFoundError: If file doesn't exist or cannot be accessed
         ValueError: If file is not a .java file
     """
-    path = Path(file_path).resolve()
+    return _check_target_file(_resolved_path(file_path))
 
-    if not path.exists():
-        raise FileNotFoundError(f"Target file not found: {path}")
+
+def _check_target_file(path: Path) -> Path:
+    """Validate an already-resolved target path (see ``validate_target_file``)."""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Target file not found: {path}") from None
+    except OSError as e:
+        # e.g. a path through a regular file (ENOTDIR) or an unreadable directory
+        raise FileNotFoundError(f"Target file not accessible: {path} ({e.strerror})") from None
 
     if path.suffix.lower() != ".java":
         raise ValueError(f"Target must be a .java file, got: {path.suffix}")
@@ -117,47 +161,48 @@ def validate_target_file(file_path: str) -> Path:
     return path
 
 
-def validate_api_key_for_llm_features() -> bool:
+def validate_api_key_for_llm_features(api_key: str | None = None) -> bool:
     """
     Validate that an API key is available for LLM features.
 
+    Args:
+        api_key: Key passed explicitly (e.g. via --api-key). When omitted,
+            the key is looked up from the environment and .env files.
+
     Returns:
         True if API key is available, False otherwise
     """
-    from genec.utils.secrets import get_anthropic_api_key
+    if api_key is None:
+        from genec.utils.secrets import get_anthropic_api_key
 
-    api_key = get_anthropic_api_key()
+        api_key = get_anthropic_api_key()
     if not api_key or len(api_key) < 10:
         return False
 
     return True
 
-import signal
-import time
-
-from dotenv import load_dotenv
-
 
 def _setup_logging(args) -> logging.Logger:
     """Configure logging based on CLI arguments.
 
     Returns the configured logger instance.
     """
-    log_level = "DEBUG" if args.verbose else "INFO"
+    # --json alone keeps INFO: the VS Code extension reads "[Stage n/m]" progress
+    # lines from stderr. --quiet lets other callers drop them, so filtered
+    # records are discarded before any handler formats them.
+    if args.verbose:
+        log_level = "DEBUG"
+    elif args.quiet:
+        log_level = "WARNING"
+    else:
+        log_level = "INFO"
 
     if args.json:
-        # Ensure logs go to stderr so they don't corrupt stdout JSON
+        # Loggers outside the "genec" hierarchy propagate to the root logger;
+        # give it a stderr handler too so nothing corrupts stdout JSON
         logging.basicConfig(stream=sys.stderr, level=getattr(logging, log_level))
-        setup_logger("genec", level=log_level)
-        _logger = logging.getLogger("genec")
-        for handler in _logger.handlers:
-            if isinstance(handler, logging.StreamHandler):
-                handler.stream = sys.stderr
-    else:
-        setup_logger("genec", level=log_level)
-        _logger = logging.getLogger("genec")
 
-    return _logger
+    return setup_logger("genec", level=log_level, stream=sys.stderr)
 
 
 def _validate_inputs(args) -> tuple[Path, Path, Path]:
@@ -171,20 +216,9 @@ def _validate_inputs(args) -> tuple[Path, Path, Path]:
     """
     _logger = logging.getLogger("genec")
 
-    # Setup API key
-    if args.api_key:
-        os.environ["ANTHROPIC_API_KEY"] = args.api_key
-
-    if not validate_api_key_for_llm_features():
-        _logger.warning(
-            "No valid API key found (checked args, env, and .env). "
-            "LLM-based naming and validation will be disabled. "
-            "Set ANTHROPIC_API_KEY environment variable or pass --api-key."
-        )
-
     # Validate target file
     try:
-        target_path = validate_target_file(args.target)
+        target_path = _check_target_file(args.target)
     except (FileNotFoundError, ValueError) as e:
         error_msg = str(e)
         if args.json:
@@ -194,10 +228,12 @@ def _validate_inputs(args) -> tuple[Path, Path, Path]:
         sys.exit(1)
 
     # Validate repository path
-    repo_path = Path(args.repo).resolve()
-    config_path = Path(args.config).resolve()
+    repo_path = args.repo
+    config_path = args.config
 
-    if not repo_path.exists():
+    try:
+        os.stat(repo_path)
+    except OSError:
         error_msg = f"Repository path not found: {repo_path}"
         if args.json:
             print(json.dumps({"status": "error", "error": error_msg}))
@@ -205,62 +241,72 @@ def _validate_inputs(args) -> tuple[Path, Path, Path]:
             _logger.error(error_msg)
         sys.exit(1)
 
+    # Setup API key (only once the paths are known to be usable; the
+    # secrets lookup is skipped entirely when --api-key is given)
+    if args.api_key:
+        os.environ["ANTHROPIC_API_KEY"] = args.api_key
+
+    if not validate_api_key_for_llm_features(args.api_key):
+        _logger.warning(
+            "No valid API key found (checked args, env, and .env). "
+            "LLM-based naming and validation will be disabled. "
+            "Set ANTHROPIC_API_KEY environment variable or pass --api-key."
+        )
+
     return target_path, repo_path, config_path
 
 
+# Boolean flags and the dotted config paths they set. Order matters: --dry-run
+# must come after --apply-all so it can switch dry_run back on.
+_FLAG_OVERRIDES = (
+    (
+        "apply_all",
+        {
+            "refactoring_application.enabled": True,
+            "refactoring_application.auto_apply": True,
+            "refactoring_application.dry_run": False,
+        },
+    ),
+    ("check_coverage", {"verification.enable_coverage": True}),
+    ("dry_run", {"refactoring_application.dry_run": True}),
+    ("use_cache", {"llm.use_cache": True}),
+    ("no_build", {"auto_build_dependencies": False}),
+)
+
+# Dotted config path -> argument copied there when given.
+_VALUE_OVERRIDES = {
+    "clustering.min_cluster_size": "min_cluster_size",
+    "clustering.max_cluster_size": "max_cluster_size",
+    "clustering.min_cohesion": "min_cohesion",
+    "clustering.seed": "seed",
+    "llm.cache_dir": "cache_dir",
+}
+
+
+def _set_dotted(target: dict, dotted: str, value) -> None:
+    """Set ``target["a"]["b"] = value`` for ``dotted="a.b"``, creating dicts."""
+    *parents, key = dotted.split(".")
+    for part in parents:
+        target = target.setdefault(part, {})
+    target[key] = value
+
+
 def _build_config_overrides(args) -> dict:
     """Build pipeline config overrides from CLI arguments."""
     config_overrides = {}
 
-    if args.apply_all:
-        config_overrides["refactoring_application"] = {
-            "enabled": True,
-            "auto_apply": True,
-            "dry_run": False,
-        }
-
-    if args.check_coverage:
-        if "verification" not in config_overrides:
-            config_overrides["verification"] = {}
-        config_overrides["verification"]["enable_coverage"] = True
-
-    if (
-        args.min_cluster_size is not None
-        or args.max_cluster_size is not None
-        or args.min_cohesion is not None
-    ):
-        clustering_overrides = {}
-        if args.min_cluster_size is not None:
-            clustering_overrides["min_cluster_size"] = args.min_cluster_size
-        if args.max_cluster_size is not None:
-            clustering_overrides["max_cluster_size"] = args.max_cluster_size
-        if args.min_cohesion is not None:
-            clustering_overrides["min_cohesion"] = args.min_cohesion
-        config_overrides["clustering"] = clustering_overrides
-
-    if args.dry_run:
-        if "refactoring_application" not in config_overrides:
-            config_overrides["refactoring_application"] = {}
-        config_overrides["refactoring_application"]["dry_run"] = True
-
-    if args.no_build:
-        config_overrides["auto_build_dependencies"] = False
-
-    if args.seed is not None:
-        if "clustering" not in config_overrides:
-            config_overrides["clustering"] = {}
-        config_overrides["clustering"]["seed"] = args.seed
-
-    if args.cache_dir or args.use_cache:
-        if "llm" not in config_overrides:
-            config_overrides["llm"] = {}
-        if args.cache_dir:
-            config_overrides["llm"]["cache_dir"] = args.cache_dir
-        if args.use_cache:
-            config_overrides["llm"]["use_cache"] = True
+    for flag, values in _FLAG_OVERRIDES:
+        if getattr(args, flag):
+            for dotted, value in values.items():
+                _set_dotted(config_overrides, dotted, value)
+
+    for dotted, arg in _VALUE_OVERRIDES.items():
+        value = getattr(args, arg)
+        if value is not None:
+            _set_dotted(config_overrides, dotted, value)
 
     if hasattr(args, "max_passes") and args.max_passes > 1:
-        config_overrides.setdefault("refactoring_application", {})["max_passes"] = args.max_passes
+        _set_dotted(config_overrides, "refactoring_application.max_passes", args.max_passes)
 
     return config_overrides
 
@@ -272,6 +318,11 @@ def _run_pipeline(args, target_path: Path, repo_path: Path, config_path: Path, c
     """
     _logger = logging.getLogger("genec")
 
+    # Imported here rather than at module level: the pipeline pulls in the
+    # LLM client, parsers and graph libraries, which --help/--version and
+    # input-validation failures never need.
+    from genec.core.pipeline import GenECPipeline
+
     pipeline = GenECPipeline(
         config_file=str(config_path) if config_path.exists() else None,
         config_overrides=config_overrides,
@@ -289,10 +340,12 @@ def _run_pipeline(args, target_path: Path, repo_path: Path, config_path: Path, c
             progress_server = get_progress_server(args.websocket)
             progress_server.start()
             _logger.info(f"WebSocket progress server started on port {args.websocket}")
+        except ImportError as e:
+            _logger.warning(f"WebSocket progress server unavailable: {e}")
         except Exception as e:
             _logger.warning(f"Failed to start WebSocket server: {e}")
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     results = pipeline.run_full_pipeline(
         class_file=str(target_path),
@@ -304,7 +357,7 @@ def _run_pipeline(args, target_path: Path, repo_path: Path, config_path: Path, c
     if args.report_dir:
         report_dir = Path(args.report_dir)
         report_dir.mkdir(parents=True, exist_ok=True)
-        report_path = report_dir / f"{Path(args.target).stem}_report.json"
+        report_path = report_dir / f"{args.target.stem}_report.json"
         report_path.write_text(json.dumps(results.pipeline_report, indent=2, default=str))
         _logger.info(f"Pipeline report saved to {report_path}")
 
@@ -319,14 +372,14 @@ def _run_pipeline(args, target_path: Path, repo_path: Path, config_path: Path, c
         )
         progress_server.stop()
 
-    total_runtime = time.time() - start_time
+    total_runtime = time.perf_counter() - start_time
     runtime_str = f"{total_runtime:.1f}s" if total_runtime < 60 else f"{total_runtime/60:.1f}m"
 
     return results, runtime_str
 
 
-def _format_json_output(results, runtime_str: str) -> str:
-    """Format pipeline results as a JSON string for machine consumption."""
+def _build_json_output(results, runtime_str: str) -> dict:
+    """Build the JSON-serializable results payload for machine consumption."""
     if not results.suggestions:
         message = (
             "No refactoring suggestions found. Possible reasons: class is already "
@@ -340,6 +393,10 @@ def _format_json_output(results, runtime_str: str) -> str:
     else:
         message = f"Successfully generated {len(results.verified_suggestions)} verified suggestions."
 
+    # Identity set: one O(1) lookup per suggestion, and no dataclass __eq__
+    # comparing generated sources field by field
+    verified_ids = {id(s) for s in results.verified_suggestions}
+
     output = {
         "status": "success",
         "message": message,
@@ -348,7 +405,7 @@ def _format_json_output(results, runtime_str: str) -> str:
         "suggestions": [
             {
                 "name": s.proposed_class_name,
-                "verified": getattr(s, "verification_status", None) == "verified",
+                "verified": id(s) in verified_ids,
                 "new_class_code": s.new_class_code or "",
                 "modified_original_code": s.modified_original_code or "",
                 "rationale": getattr(s, "rationale", None),
@@ -392,64 +449,123 @@ def _format_json_output(results, runtime_str: str) -> str:
             for i, c in enumerate(results.ranked_clusters)
         ],
     }
-    return json.dumps(output, indent=2)
+    return output
+
+
+def _write_json_output(results, runtime_str: str, stream=None) -> None:
+    """Write pipeline results as indented JSON.
+
+    When ``orjson`` is installed and the stream exposes a binary buffer, the
+    payload is encoded to UTF-8 bytes in one native call and written to the
+    buffer directly. Otherwise the stdlib encoder builds the whole document
+    before it is written. Either way an unserializable value raises before
+    anything reaches the stream.
+
+    Args:
+        results: Pipeline results to serialize
+        runtime_str: Formatted total runtime
+        stream: Text stream to write to (default: sys.stdout)
+    """
+    stream = stream or sys.stdout
+    output = _build_json_output(results, runtime_str)
+
+    buffer = getattr(stream, "buffer", None)
+    if buffer is not None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(
+                    output,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_APPEND_NEWLINE,
+                )
+            except TypeError:
+                # Types orjson rejects still get the stdlib encoder below
+                payload = None
+            if payload is not None:
+                stream.flush()
+                buffer.write(payload)
+                buffer.flush()
+                return
+
+    # Encode fully before writing, so a value that cannot be serialized
+    # raises without leaving a partial document on the stream
+    stream.write(json.dumps(output, indent=2) + "\n")
+    stream.flush()
 
 
 def _format_text_output(results, runtime_str: str, args, target_path: Path) -> None:
-    """Print human-readable pipeline results to stdout."""
+    """Print human-readable pipeline results to stdout.
+
+    Lines are collected in a buffer and written with a single call, rather
+    than one (possibly line-buffered) write per ``print``.
+    """
+    buf = io.StringIO()
+    emit = functools.partial(print, file=buf)
+
     # Dry-run mode: show detailed summary of what WOULD be applied
     if args.dry_run and results.verified_suggestions:
-        print("\n" + "=" * 60)
-        print("DRY-RUN SUMMARY - No changes will be made")
-        print("=" * 60)
-        print(f"\nFile: {target_path.name}")
-        print(f"Total verified suggestions: {len(results.verified_suggestions)}")
-        print("\nChanges that WOULD be applied:\n")
+        emit("\n" + "=" * 60)
+        emit("DRY-RUN SUMMARY - No changes will be made")
+        emit("=" * 60)
+        emit(f"\nFile: {target_path.name}")
+        emit(f"Total verified suggestions: {len(results.verified_suggestions)}")
+        emit("\nChanges that WOULD be applied:\n")
 
         for i, s in enumerate(results.verified_suggestions, 1):
             methods = s.cluster.get_methods() if hasattr(s, 'cluster') and s.cluster else []
             method_count = len(methods) if methods else "unknown"
 
             confidence_str = f" (confidence: {s.confidence_score:.2f})" if s.confidence_score is not None else ""
-            print(f"  {i}. Extract class: {s.proposed_class_name}{confidence_str}")
-            print(f"     Methods to move: {method_count}")
+            emit(f"  {i}. Extract class: {s.proposed_class_name}{confidence_str}")
+            emit(f"     Methods to move: {method_count}")
             if methods:
                 for m in methods[:5]:
-                    print(f"       - {m}")
+                    emit(f"       - {m}")
                 if len(methods) > 5:
-                    print(f"       ... and {len(methods) - 5} more")
+                    emit(f"       ... and {len(methods) - 5} more")
             reasoning = getattr(s, "reasoning", None)
             if reasoning:
-                print(f"     Reason: {reasoning[:100]}...")
-            print()
+                emit(f"     Reason: {reasoning[:100]}...")
+            emit()
 
-        print("-" * 60)
-        print("To apply these changes, run without --dry-run flag")
-        print("=" * 60)
+        emit("-" * 60)
+        emit("To apply these changes, run without --dry-run flag")
+        emit("=" * 60)
 
-    print("\n" + "=" * 50)
-    print(f"Refactoring Completed Successfully (Runtime: {runtime_str})")
-    print("=" * 50)
-    print(f"Original Metrics: {results.original_metrics}")
-    print(f"Suggestions Generated: {len(results.suggestions)}")
-    print(f"Verified Suggestions: {len(results.verified_suggestions)}")
+    emit("\n" + "=" * 50)
+    emit(f"Refactoring Completed Successfully (Runtime: {runtime_str})")
+    emit("=" * 50)
+    emit(f"Original Metrics: {results.original_metrics}")
+    emit(f"Suggestions Generated: {len(results.suggestions)}")
+    emit(f"Verified Suggestions: {len(results.verified_suggestions)}")
 
     if results.avg_confidence > 0:
-        print(f"Confidence Metrics: avg={results.avg_confidence:.2f}, "
+        emit(f"Confidence Metrics: avg={results.avg_confidence:.2f}, "
               f"min={results.min_confidence:.2f}, max={results.max_confidence:.2f}, "
               f"high(>=0.8)={results.high_confidence_count}")
 
-    print(f"Total Runtime: {runtime_str}")
+    emit(f"Total Runtime: {runtime_str}")
 
     if results.verified_suggestions:
-        print("\nVerified Suggestions:")
+        emit("\nVerified Suggestions:")
         for i, s in enumerate(results.verified_suggestions, 1):
             confidence_str = f" (confidence: {s.confidence_score:.2f})" if s.confidence_score is not None else ""
-            print(f"{i}. {s.proposed_class_name}{confidence_str}")
+            emit(f"{i}. {s.proposed_class_name}{confidence_str}")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main():
-    load_dotenv()
+    # Parse first: --help and --version exit here, before any handler or .env work
+    args = _get_parser().parse_args()
 
     # Install signal handlers for graceful cancellation
     _cancellation_requested = False
@@ -464,7 +580,18 @@ def main():
     signal.signal(signal.SIGINT, handle_sigint)
     signal.signal(signal.SIGTERM, handle_sigint)
 
-    args = create_parser().parse_args()
+    from dotenv import find_dotenv, load_dotenv
+
+    from genec.utils.paths import get_zipapp_archive
+
+    # GENEC_DOTENV pins the .env file and skips the upward directory search
+    dotenv_path = os.environ.get("GENEC_DOTENV")
+    if dotenv_path is None and get_zipapp_archive() is not None:
+        # find_dotenv() starts from the caller's source file, which a zipapp
+        # does not have, so search upward from the working directory instead
+        dotenv_path = find_dotenv(usecwd=True)
+    load_dotenv(dotenv_path=dotenv_path, override=False)
+
     _logger = _setup_logging(args)
     target_path, repo_path, config_path = _validate_inputs(args)
     config_overrides = _build_config_overrides(args)
@@ -473,7 +600,7 @@ def main():
         results, runtime_str = _run_pipeline(args, target_path, repo_path, config_path, config_overrides)
 
         if args.json:
-            print(_format_json_output(results, runtime_str))
+            _write_json_output(results, runtime_str)
         else:
             _format_text_output(results, runtime_str, args, target_path)
 
@@ -491,14 +618,17 @@ def main():
         sys.exit(1)
     finally:
         generated_file = target_path.parent / "generated.java"
-        if generated_file.exists():
-            try:
-                generated_file.unlink()
-                if not args.json:
-                    _logger.info(f"Cleaned up artifact: {generated_file}")
-            except Exception as e:
-                if not args.json:
-                    _logger.warning(f"Failed to cleanup artifact {generated_file}: {e}")
+        # Single unlink attempt; a missing file is the common case, not an error
+        try:
+            generated_file.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            if not args.json:
+                _logger.warning(f"Failed to cleanup artifact {generated_file}: {e}")
+        else:
+            if not args.json:
+                _logger.info(f"Cleaned up artifact: {generated_file}")
 
 
 if __name__ == "__main__":
@@ -5,13 +5,64 @@ Provides type-safe, validated configuration with clear error messages
 and automatic validation of all configuration values.
 """
 
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# libyaml-backed safe loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class FusionConfig(BaseModel):
+
+class _NoAliasesMixin:
+    """Dumper mixin that writes shared objects out in full."""
+
+    def ignore_aliases(self, data) -> bool:
+        # Shared default objects must be written out in full, as the
+        # model_dump() copies used to be, not as YAML anchors/aliases
+        return True
+
+
+# Safe dumper that writes pydantic models directly, skipping None values;
+# libyaml-backed when available. A subclass, so the representer does not
+# leak into PyYAML's global dumpers.
+if hasattr(yaml, "CSafeDumper"):
+
+    class _ConfigDumper(_NoAliasesMixin, yaml.CSafeDumper):
+        """Safe dumper for config models (libyaml emitter)."""
+
+else:
+
+    class _ConfigDumper(_NoAliasesMixin, yaml.SafeDumper):  # type: ignore[no-redef]
+        """Safe dumper for config models (pure-Python emitter)."""
+
+
+def _represent_model(dumper: _ConfigDumper, data: BaseModel) -> yaml.Node:
+    return dumper.represent_dict(
+        (name, value) for name, value in data.__dict__.items() if value is not None
+    )
+
+
+_ConfigDumper.add_multi_representer(BaseModel, _represent_model)
+
+
+class _SectionConfig(BaseModel):
+    """Base for config sections: immutable once loaded.
+
+    Frozen sections are hashable when their fields are, and can be shared
+    safely (e.g. from the parsed-config cache). Derive variants with
+    ``model_copy(update=...)``.
+    """
+
+    model_config = {"frozen": True}
+
+
+class FusionConfig(_SectionConfig):
     """Configuration for graph fusion."""
 
     alpha: float = Field(
@@ -37,7 +88,7 @@ class FusionConfig(BaseModel):
     )
 
 
-class EvolutionConfig(BaseModel):
+class EvolutionConfig(_SectionConfig):
     """Configuration for evolutionary coupling analysis."""
 
     window_months: int = Field(
@@ -54,10 +105,14 @@ class EvolutionConfig(BaseModel):
     )
 
 
-class ClusteringConfig(BaseModel):
+class ClusteringConfig(_SectionConfig):
     """Configuration for cluster detection."""
 
     algorithm: str = Field(default="leiden", description="Clustering algorithm to use.")
+    louvain_backend: str = Field(
+        default="igraph",
+        description="Louvain implementation: 'igraph' (C, when installed) or 'python-louvain'.",
+    )
     min_cluster_size: int = Field(
         default=3, ge=2, description="Minimum number of members in a cluster."
     )
@@ -75,6 +130,11 @@ class ClusteringConfig(BaseModel):
     seed: int | None = Field(
         default=42, description="Random seed for reproducible clustering (None for non-deterministic)."
     )
+    silhouette_sample_size: int = Field(
+        default=5000,
+        ge=2,
+        description="Node count beyond which silhouette scores are estimated on a sample.",
+    )
 
     @field_validator("algorithm")
     @classmethod
@@ -85,6 +145,15 @@ class ClusteringConfig(BaseModel):
             raise ValueError(f"algorithm must be one of {allowed}, got: {v}")
         return v
 
+    @field_validator("louvain_backend")
+    @classmethod
+    def validate_louvain_backend(cls, v: str) -> str:
+        """Validate Louvain implementation."""
+        allowed = {"igraph", "python-louvain"}
+        if v not in allowed:
+            raise ValueError(f"louvain_backend must be one of {allowed}, got: {v}")
+        return v
+
     @model_validator(mode="after")
     def validate_cluster_sizes(self) -> "ClusteringConfig":
         """Validate that max_cluster_size >= min_cluster_size."""
@@ -96,7 +165,7 @@ class ClusteringConfig(BaseModel):
         return self
 
 
-class ChunkingConfig(BaseModel):
+class ChunkingConfig(_SectionConfig):
     """Configuration for code chunking."""
 
     enabled: bool = Field(default=True, description="Enable intelligent code chunking for LLM.")
@@ -106,7 +175,7 @@ class ChunkingConfig(BaseModel):
     )
 
 
-class LLMConfig(BaseModel):
+class LLMConfig(_SectionConfig):
     """Configuration for LLM interface."""
 
     provider: str = Field(default="anthropic", description="LLM provider to use.")
@@ -153,7 +222,7 @@ class LLMConfig(BaseModel):
         return v
 
 
-class CodeGenerationConfig(BaseModel):
+class CodeGenerationConfig(_SectionConfig):
     """Configuration for code generation."""
 
     engine: str = Field(default="eclipse_jdt", description="Code generation engine to use.")
@@ -174,7 +243,7 @@ class CodeGenerationConfig(BaseModel):
         return v
 
 
-class VerificationConfig(BaseModel):
+class VerificationConfig(_SectionConfig):
     """Configuration for refactoring verification."""
 
     enable_syntactic: bool = Field(
@@ -221,7 +290,7 @@ class VerificationConfig(BaseModel):
     )
 
 
-class StructuralTransformsConfig(BaseModel):
+class StructuralTransformsConfig(_SectionConfig):
     """Configuration for structural transformations."""
 
     enabled: bool = Field(default=False, description="Enable structural transformations.")
@@ -248,7 +317,7 @@ class StructuralTransformsConfig(BaseModel):
     )
 
 
-class RefactoringApplicationConfig(BaseModel):
+class RefactoringApplicationConfig(_SectionConfig):
     """Configuration for refactoring application."""
 
     enabled: bool = Field(default=False, description="Enable refactoring application stage.")
@@ -262,7 +331,7 @@ class RefactoringApplicationConfig(BaseModel):
     )
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_SectionConfig):
     """Configuration for logging."""
 
     level: str = Field(default="INFO", description="Logging level.")
@@ -283,7 +352,7 @@ class LoggingConfig(BaseModel):
         return v_upper
 
 
-class CacheConfig(BaseModel):
+class CacheConfig(_SectionConfig):
     """Configuration for caching."""
 
     enable: bool = Field(default=True, description="Enable caching of expensive operations.")
@@ -291,7 +360,7 @@ class CacheConfig(BaseModel):
     ttl_days: int = Field(default=7, ge=1, description="Time-to-live for cache entries in days.")
 
 
-class AnalysisConfig(BaseModel):
+class AnalysisConfig(_SectionConfig):
     """Configuration for dependency analysis."""
 
     use_spoon: bool = Field(
@@ -327,12 +396,110 @@ class GenECConfig(BaseModel):
     }
 
 
-def load_config(config_file: str = "config/config.yaml") -> GenECConfig:
+# Set this environment variable (to any non-empty value) to bypass the
+# parsed-config cache used by load_config().
+CONFIG_CACHE_DISABLE_ENV = "GENEC_NO_CONFIG_CACHE"
+
+
+def _config_cache_file(config_path: Path) -> Path:
+    """Return the cache slot for a config path; each path owns one slot."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "genec"
+    key = hashlib.blake2b(str(config_path.resolve()).encode(), digest_size=16).hexdigest()
+    return cache_root / f"config-{key}.pkl"
+
+
+@functools.cache
+def _schema_fingerprint() -> str:
+    """Digest of the genec version and every config field's type and default.
+
+    Part of the cache stamp, so pickles written by another genec version or
+    config schema are re-parsed instead of loaded as models missing fields.
+    Walking model_fields is far cheaper than hashing model_json_schema().
+    """
+    from genec import __version__
+
+    lines = [__version__]
+    pending: list[type[BaseModel]] = [GenECConfig]
+    while pending:
+        model = pending.pop()
+        for name, field in model.model_fields.items():
+            lines.append(f"{model.__name__}.{name}: {field.annotation!r} = {field.default!r}")
+            if isinstance(field.annotation, type) and issubclass(field.annotation, BaseModel):
+                pending.append(field.annotation)
+    return hashlib.blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
+
+
+def _cache_stamp(stat: os.stat_result) -> tuple[int, int, str]:
+    """Return the (mtime_ns, size, schema fingerprint) that validates a cache entry."""
+    return stat.st_mtime_ns, stat.st_size, _schema_fingerprint()
+
+
+def _read_cached_config(cache_file: Path, stamp: tuple[int, int, str]) -> GenECConfig | None:
+    """Load a cached GenECConfig, or None on a miss, stale or unreadable entry."""
+    try:
+        with open(cache_file, "rb") as f:
+            # Security note: pickle.load is used here for a LOCAL cache only,
+            # written by _write_cached_config under the user's cache directory.
+            cached_stamp, config = pickle.load(f)  # nosec B301
+    except Exception:
+        return None
+    if cached_stamp != stamp or not isinstance(config, GenECConfig):
+        return None
+    return config
+
+
+def _write_cached_config(
+    cache_file: Path, stamp: tuple[int, int, str], config: GenECConfig
+) -> None:
+    """Atomically store a parsed config; failures only cost the cache."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception:
+        pass
+
+
+def _parse_config_file(config_path: Path) -> GenECConfig:
+    """Parse and validate a YAML configuration file (no caching)."""
+    try:
+        # Bytes go straight to the loader, which detects the encoding itself
+        with open(config_path, "rb") as f:
+            config_dict = yaml.load(f, Loader=_YAML_LOADER)  # nosec B506 - safe loader
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse YAML configuration: {e}")
+
+    if config_dict is None:
+        config_dict = {}
+
+    try:
+        # One pydantic-core pass over the raw dict; sections absent from the
+        # file take their (unvalidated) defaults inside that same call
+        return GenECConfig.model_validate(config_dict)
+    except Exception as e:
+        raise ValueError(f"Invalid configuration: {e}")
+
+
+def load_config(config_file: str = "config/config.yaml", use_cache: bool = True) -> GenECConfig:
     """
     Load and validate GenEC configuration from YAML file.
 
+    Parsed configs are cached as pickles under ``~/.cache/genec``, one entry
+    per absolute path, stamped with the file's mtime and size and a
+    fingerprint of the config schema, so unchanged files skip YAML parsing
+    and validation on later runs, while an edited file or a genec upgrade
+    overwrites the previous entry. Set ``GENEC_NO_CONFIG_CACHE`` to
+    disable the cache globally.
+
     Args:
         config_file: Path to YAML configuration file
+        use_cache: Whether to read/write the parsed-config cache
 
     Returns:
         Validated GenECConfig instance
@@ -344,22 +511,24 @@ def load_config(config_file: str = "config/config.yaml") -> GenECConfig:
     """
     config_path = Path(config_file)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_file}")
-
     try:
-        with open(config_path) as f:
-            config_dict = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Failed to parse YAML configuration: {e}")
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_file}") from None
 
-    if config_dict is None:
-        config_dict = {}
+    cache_file = None
+    if use_cache and not os.environ.get(CONFIG_CACHE_DISABLE_ENV):
+        cache_file = _config_cache_file(config_path)
+        cached = _read_cached_config(cache_file, _cache_stamp(stat))
+        if cached is not None:
+            return cached
 
-    try:
-        return GenECConfig(**config_dict)
-    except Exception as e:
-        raise ValueError(f"Invalid configuration: {e}")
+    config = _parse_config_file(config_path)
+
+    if cache_file is not None:
+        _write_cached_config(cache_file, _cache_stamp(stat), config)
+
+    return config
 
 
 def save_config(config: GenECConfig, config_file: str = "config/config.yaml") -> None:
@@ -373,8 +542,7 @@ def save_config(config: GenECConfig, config_file: str = "config/config.yaml") ->
     config_path = Path(config_file)
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to dict and remove None values for cleaner output
-    config_dict = config.model_dump(exclude_none=True)
-
+    # Models are represented in place (None values dropped for cleaner
+    # output) instead of first copying the whole tree with model_dump()
     with open(config_path, "w") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_ConfigDumper, default_flow_style=False, sort_keys=False)
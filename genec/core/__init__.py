@@ -1,34 +1,60 @@
 """Core GenEC modules."""
 
-from genec.core.cluster_detector import ClusterDetector
-from genec.core.dependency_analyzer import (
-    ClassDependencies,
-    DependencyAnalyzer,
-    FieldInfo,
-    MethodInfo,
-)
-from genec.core.evolutionary_miner import EvolutionaryData, EvolutionaryMiner
-from genec.core.graph_builder import GraphBuilder
-from genec.core.llm_interface import LLMInterface
-from genec.core.models import Cluster, QualityTier, RefactoringSuggestion, VerificationResult
-from genec.core.pipeline import GenECPipeline, PipelineResult
-from genec.core.verification_engine import VerificationEngine
-
-__all__ = [
-    "DependencyAnalyzer",
-    "ClassDependencies",
-    "MethodInfo",
-    "FieldInfo",
-    "EvolutionaryMiner",
-    "EvolutionaryData",
-    "GraphBuilder",
-    "ClusterDetector",
-    "Cluster",
-    "QualityTier",
-    "LLMInterface",
-    "RefactoringSuggestion",
-    "VerificationEngine",
-    "VerificationResult",
-    "GenECPipeline",
-    "PipelineResult",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static view of the lazily loaded exports for type checkers and IDEs
+    from genec.core.cluster_detector import ClusterDetector
+    from genec.core.dependency_analyzer import (
+        ClassDependencies,
+        DependencyAnalyzer,
+        FieldInfo,
+        MethodInfo,
+    )
+    from genec.core.evolutionary_miner import EvolutionaryData, EvolutionaryMiner
+    from genec.core.graph_builder import GraphBuilder
+    from genec.core.llm_interface import LLMInterface
+    from genec.core.models import Cluster, QualityTier, RefactoringSuggestion, VerificationResult
+    from genec.core.pipeline import GenECPipeline, PipelineResult
+    from genec.core.verification_engine import VerificationEngine
+
+# Public name -> defining module. Submodules are imported on first attribute
+# access, so `from genec.core import Cluster` loads only genec.core.models
+# rather than the pipeline, LLM client and graph libraries.
+_LAZY = {
+    "DependencyAnalyzer": "genec.core.dependency_analyzer",
+    "ClassDependencies": "genec.core.dependency_analyzer",
+    "MethodInfo": "genec.core.dependency_analyzer",
+    "FieldInfo": "genec.core.dependency_analyzer",
+    "EvolutionaryMiner": "genec.core.evolutionary_miner",
+    "EvolutionaryData": "genec.core.evolutionary_miner",
+    "GraphBuilder": "genec.core.graph_builder",
+    "ClusterDetector": "genec.core.cluster_detector",
+    "Cluster": "genec.core.models",
+    "QualityTier": "genec.core.models",
+    "LLMInterface": "genec.core.llm_interface",
+    "RefactoringSuggestion": "genec.core.models",
+    "VerificationEngine": "genec.core.verification_engine",
+    "VerificationResult": "genec.core.models",
+    "GenECPipeline": "genec.core.pipeline",
+    "PipelineResult": "genec.core.pipeline",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
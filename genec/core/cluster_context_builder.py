@@ -39,7 +39,24 @@ class ClusterContextBuilder:
         """
         self.include_imports = include_imports
         self.include_unused_fields_comment = include_unused_fields_comment
-        self.logger = logger
+
+        # Method lookup tables for the most recent ClassDependencies. Sibling
+        # clusters of one class are built back to back, so a single entry
+        # (holding a reference, so the identity check cannot be fooled by id
+        # reuse) is enough to index each class once.
+        self._indexed_deps: ClassDependencies | None = None
+        self._method_index: tuple[list[MethodInfo], dict[str, list[str]], set[str]] | None = None
+
+        # Built contexts for the indexed class, keyed by the cluster's method
+        # signatures (the only cluster input the context depends on). Prompt
+        # variants and retries for one cluster reuse the same string.
+        self._context_cache: dict[frozenset[str], str] = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached indexes and contexts, e.g. after mutating class_deps in place."""
+        self._indexed_deps = None
+        self._method_index = None
+        self._context_cache.clear()
 
     def build_context(self, cluster: Cluster, class_deps: ClassDependencies) -> str:
         """
@@ -79,116 +96,99 @@ class ClusterContextBuilder:
             // Dependencies (methods called by cluster): (none)
             // Fields not used: email, phoneNumber, address
         """
-        lines = []
+        # Computed once and shared by the helpers below
+        cluster_sigs = frozenset(cluster.get_methods())
+        all_methods, _, _ = self._index_methods(class_deps)
+
+        cached = self._context_cache.get(cluster_sigs)
+        if cached is not None:
+            return cached
 
         # Add high-level context
-        lines.append(f"// From class: {class_deps.class_name}")
+        lines = [f"// From class: {class_deps.class_name}"]
         if class_deps.package_name:
             lines.append(f"// Package: {class_deps.package_name}")
         lines.append("")
 
         # Extract and format used fields
-        used_fields = self._get_used_fields(cluster, class_deps)
+        used_fields, unused_fields = self._partition_fields(cluster_sigs, class_deps)
         if used_fields:
             lines.append("// Fields used by this cluster:")
-            for field in used_fields:
-                field_code = self._format_field(field)
-                lines.append(field_code)
+            lines.extend(map(self._format_field, used_fields))
             lines.append("")
 
         # Extract cluster methods with full bodies
-        cluster_methods = self._get_cluster_methods(cluster, class_deps)
+        cluster_methods = self._get_cluster_methods(cluster_sigs, all_methods)
         if cluster_methods:
             lines.append("// Methods in this cluster:")
+            # MethodInfo.body already contains full method code; each body is
+            # followed by a blank separator line
             for method in cluster_methods:
-                # MethodInfo.body already contains full method code
-                lines.append(method.body.rstrip())
-                lines.append("")
+                lines += (method.body.rstrip(), "")
         else:
-            self.logger.warning(f"Cluster {cluster.id} has no methods with bodies")
+            logger.warning(f"Cluster {cluster.id} has no methods with bodies")
 
         # Show method dependencies (what cluster calls)
-        dependencies = self._get_dependencies(cluster, class_deps)
+        dependencies = self._get_dependencies(cluster_sigs, class_deps)
         if dependencies:
             lines.append("// Dependencies (methods called by cluster):")
-            for dep_sig in sorted(dependencies):
-                lines.append(f"//   - {dep_sig}")
+            lines.extend(f"//   - {dep_sig}" for dep_sig in sorted(dependencies))
         else:
             lines.append("// Dependencies (methods called by cluster): (none)")
 
         # Show unused fields as comment (helps LLM understand scope)
-        if self.include_unused_fields_comment:
-            unused_fields = self._get_unused_fields(cluster, class_deps)
-            if unused_fields:
-                unused_names = [f.name for f in unused_fields]
-                lines.append(f"// Fields not used: {', '.join(sorted(unused_names))}")
+        if self.include_unused_fields_comment and unused_fields:
+            unused_names = [f.name for f in unused_fields]
+            lines.append(f"// Fields not used: {', '.join(sorted(unused_names))}")
 
         context = "\n".join(lines)
+        self._context_cache[cluster_sigs] = context
 
         # Log token savings
         self._log_token_savings(cluster, class_deps, context)
 
         return context
 
-    def _get_used_fields(self, cluster: Cluster, class_deps: ClassDependencies) -> list[FieldInfo]:
-        """
-        Get fields accessed by cluster methods.
-
-        Args:
-            cluster: Cluster to analyze
-            class_deps: Full class dependencies
-
-        Returns:
-            List of FieldInfo objects for fields used by cluster
-        """
-        used_field_names = set()
-
-        # Get all method signatures in cluster
-        cluster_method_sigs = set(cluster.get_methods())
-
-        # Collect fields accessed by each cluster method
-        for method_sig in cluster_method_sigs:
-            accessed = class_deps.field_accesses.get(method_sig, [])
-            used_field_names.update(accessed)
-
-        # Return FieldInfo objects for used fields
-        return [f for f in class_deps.fields if f.name in used_field_names]
-
-    def _get_unused_fields(
-        self, cluster: Cluster, class_deps: ClassDependencies
-    ) -> list[FieldInfo]:
+    def _partition_fields(
+        self, cluster_sigs: frozenset[str], class_deps: ClassDependencies
+    ) -> tuple[list[FieldInfo], list[FieldInfo]]:
         """
-        Get fields NOT accessed by cluster.
+        Split class fields into those accessed by cluster methods and the rest.
 
-        Useful to show LLM what's out of scope for this cluster.
+        Unused fields are useful to show the LLM what's out of scope for
+        this cluster.
 
         Args:
-            cluster: Cluster to analyze
+            cluster_sigs: Signatures of the cluster's methods
             class_deps: Full class dependencies
 
         Returns:
-            List of FieldInfo objects for unused fields
+            Tuple of (used fields, unused fields), each in declaration order
         """
-        used = self._get_used_fields(cluster, class_deps)
-        used_names = {f.name for f in used}
-        return [f for f in class_deps.fields if f.name not in used_names]
+        # Fields accessed by any cluster method
+        used_field_names = set().union(
+            *(class_deps.field_accesses.get(sig, ()) for sig in cluster_sigs)
+        )
+
+        used: list[FieldInfo] = []
+        unused: list[FieldInfo] = []
+        for f in class_deps.fields:
+            (used if f.name in used_field_names else unused).append(f)
+        return used, unused
 
     def _get_cluster_methods(
-        self, cluster: Cluster, class_deps: ClassDependencies
+        self, cluster_sigs: frozenset[str], all_methods: list[MethodInfo]
     ) -> list[MethodInfo]:
         """
         Get MethodInfo objects for cluster members.
 
         Args:
-            cluster: Cluster to extract methods from
-            class_deps: Full class dependencies
+            cluster_sigs: Signatures of the cluster's methods
+            all_methods: All methods and constructors of the class
 
         Returns:
             List of MethodInfo objects with full method bodies
         """
-        cluster_sigs = set(cluster.get_methods())
-        all_methods = class_deps.get_all_methods()
-
         # Filter methods that are in cluster
         cluster_methods = [m for m in all_methods if m.signature in cluster_sigs]
 
@@ -197,7 +197,9 @@ class ClusterContextBuilder:
 
         return cluster_methods
 
-    def _get_dependencies(self, cluster: Cluster, class_deps: ClassDependencies) -> set[str]:
+    def _get_dependencies(
+        self, cluster_sigs: frozenset[str], class_deps: ClassDependencies
+    ) -> set[str]:
         """
         Get methods called by cluster (but not in cluster).
 
@@ -205,41 +207,52 @@ class ClusterContextBuilder:
         which helps LLM understand cluster's role.
 
         Args:
-            cluster: Cluster to analyze
+            cluster_sigs: Signatures of the cluster's methods
             class_deps: Full class dependencies
 
         Returns:
             Set of method signatures called by cluster
         """
-        cluster_sigs = set(cluster.get_methods())
-        all_methods = class_deps.get_all_methods()
-        name_to_sigs: dict[str, list[str]] = {}
-        sig_set = {m.signature for m in all_methods}
-        for method in all_methods:
-            name_to_sigs.setdefault(method.name, []).append(method.signature)
-        dependencies = set()
-
-        # For each method in cluster
-        for method_sig in cluster_sigs:
-            # Get methods it calls
-            called = class_deps.method_calls.get(method_sig, [])
-
-            # Find signatures of called methods (not in cluster)
-            for called_entry in called:
-                if "(" in called_entry and called_entry in sig_set:
-                    if called_entry not in cluster_sigs:
-                        dependencies.add(called_entry)
-                    continue
-
-                called_name = (
-                    called_entry.split("(", 1)[0] if "(" in called_entry else called_entry
-                )
-                for sig in name_to_sigs.get(called_name, []):
-                    if sig not in cluster_sigs:
-                        dependencies.add(sig)
+        _, name_to_sigs, sig_set = self._index_methods(class_deps)
+
+        # Everything any cluster method calls, deduplicated up front
+        called = set().union(*(class_deps.method_calls.get(sig, ()) for sig in cluster_sigs))
 
+        # Entries recorded with a full signature resolve to themselves; bare
+        # names (or unknown signatures) expand to every overload of the name
+        dependencies = called & sig_set
+        for called_entry in called - sig_set:
+            dependencies.update(name_to_sigs.get(called_entry.split("(", 1)[0], ()))
+
+        dependencies -= cluster_sigs
         return dependencies
 
+    def _index_methods(
+        self, class_deps: ClassDependencies
+    ) -> tuple[list[MethodInfo], dict[str, list[str]], set[str]]:
+        """
+        Index the class's methods for signature lookups, once per class.
+
+        Args:
+            class_deps: Full class dependencies
+
+        Returns:
+            Tuple of (all methods, method name -> overload signatures,
+            set of all signatures)
+        """
+        if self._indexed_deps is not class_deps:
+            all_methods = class_deps.get_all_methods()
+            name_to_sigs: dict[str, list[str]] = {}
+            for method in all_methods:
+                name_to_sigs.setdefault(method.name, []).append(method.signature)
+            sig_set = {m.signature for m in all_methods}
+
+            self._indexed_deps = class_deps
+            self._method_index = (all_methods, name_to_sigs, sig_set)
+            self._context_cache.clear()
+
+        return self._method_index
+
     def _format_field(self, field: FieldInfo) -> str:
         """
         Format field declaration as Java code.
@@ -254,8 +267,9 @@ class ClusterContextBuilder:
             "private String username;"
             "public static final int MAX_SIZE = 100;"
         """
-        modifiers = " ".join(field.modifiers) if field.modifiers else "private"
-        return f"{modifiers} {field.type} {field.name};"
+        # Fields without modifiers are shown as private
+        modifiers = field.modifiers or ("private",)
+        return " ".join((*modifiers, field.type, field.name)) + ";"
 
     def _log_token_savings(
         self, cluster: Cluster, class_deps: ClassDependencies, context: str
@@ -268,6 +282,9 @@ class ClusterContextBuilder:
             class_deps: Full class dependencies
             context: Generated context string
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         # Estimate tokens (rough: 1 token ≈ 4 characters)
         context_tokens = len(context) // 4
 
@@ -275,7 +292,7 @@ class ClusterContextBuilder:
         num_methods = len(cluster.get_methods())
         num_fields = len(cluster.get_fields())
 
-        self.logger.info(
+        logger.info(
             f"Cluster {cluster.id}: Generated context with ~{context_tokens} tokens "
             f"({num_methods} methods, {num_fields} fields)"
         )
@@ -1,24 +1,36 @@
 """Cluster detection using Louvain or Leiden community detection algorithms."""
 
+import concurrent.futures
+import heapq
+import multiprocessing
+import random
 import re
 from collections import defaultdict
+from itertools import repeat
 
 import community as community_louvain
 import networkx as nx
 import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 
 # Optional imports for enhanced features
 try:
     import igraph as ig
+
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    IGRAPH_AVAILABLE = False
+
+try:
     import leidenalg
 
-    LEIDEN_AVAILABLE = True
+    LEIDEN_AVAILABLE = IGRAPH_AVAILABLE
 except ImportError:
     LEIDEN_AVAILABLE = False
 
 try:
-    from sklearn.metrics import silhouette_score
-    from sklearn.preprocessing import StandardScaler
+    from sklearn.metrics import silhouette_samples, silhouette_score
 
     SKLEARN_AVAILABLE = True
 except ImportError:
@@ -38,6 +50,21 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Default method-name prefixes for pattern-based fallback clustering. A prefix
+# only counts when a capital follows it, and all are lowercase, so a method
+# matches exactly when its text before the first capital is in this set.
+_DEFAULT_PREFIXES = frozenset(
+    (
+        "is has get set contain contains start starts end ends split join strip trim pad "
+        "remove replace substring index count check validate find search "
+        "parse format convert to from create build add append prepend insert "
+        "delete truncate wrap unwrap escape unescape encode decode normalize "
+        "compare equal equals matche matches empty blank null default abbreviate "
+        "capitalize center chop reverse rotate swap overlay repeat difference"
+    ).split()
+)
+_CAMEL_WORD_RE = re.compile(r"[A-Z][a-z]*")
+
 
 def _normalize_method_for_coupling(method: str) -> str:
     """Strip parameters for coupling lookup (handles signature variants)."""
@@ -195,6 +222,10 @@ class ClusterDetector:
         self.seed = seed
         self.logger = get_logger(self.__class__.__name__)
 
+        # Member-name sets of the last class passed to validate_extractability
+        self._indexed_deps: ClassDependencies | None = None
+        self._member_index: tuple[set[str], set[str]] | None = None
+
         # Extract clustering config
         self.clustering_config = self.config.get("clustering", {})
 
@@ -209,7 +240,9 @@ class ClusterDetector:
         # Feature flags
         self.validate_connectivity = self.clustering_config.get("validate_connectivity", True)
         self.split_disconnected = self.clustering_config.get("split_disconnected", True)
+        self.louvain_backend = self.clustering_config.get("louvain_backend", "igraph")
         self.quality_metrics_config = self.clustering_config.get("quality_metrics", {})
+        self.silhouette_sample_size = self.clustering_config.get("silhouette_sample_size", 5000)
         self.multi_resolution_config = self.clustering_config.get("multi_resolution", {})
         self.stability_config = self.clustering_config.get("stability_analysis", {})
 
@@ -298,48 +331,64 @@ class ClusterDetector:
 
         return clusters
 
-    def _detect_communities(self, G: nx.Graph, resolution: float) -> list[Cluster]:
+    def _detect_communities(
+        self,
+        G: nx.Graph,
+        resolution: float,
+        ig_graph: "ig.Graph | None" = None,
+        adjacency: tuple | None = None,
+    ) -> list[Cluster]:
         """
         Detect communities with specified resolution.
 
         Args:
             G: Graph to cluster
             resolution: Resolution parameter
+            ig_graph: Prebuilt igraph copy of G, for callers clustering G repeatedly
+            adjacency: Prebuilt weight matrix of G from _build_weight_matrix
 
         Returns:
             List of detected clusters
         """
         if self.algorithm == "leiden":
-            partition, modularity = self._detect_communities_leiden(G, resolution)
+            partition, modularity = self._detect_communities_leiden(G, resolution, ig_graph)
         else:
-            partition, modularity = self._detect_communities_louvain(G, resolution)
+            partition, modularity = self._detect_communities_louvain(G, resolution, ig_graph)
 
         self.logger.info(f"Graph modularity: {modularity:.4f}")
 
         # Group nodes by community
-        communities: dict[int, list[str]] = {}
+        communities: defaultdict[int, list[str]] = defaultdict(list)
         for node, comm_id in partition.items():
-            if comm_id not in communities:
-                communities[comm_id] = []
             communities[comm_id].append(node)
 
+        # Node types read once for every community's member_types
+        node_types = dict(G.nodes(data="type", default="method"))
+
+        # One weight matrix serves connectivity checks and every metric below
+        if adjacency is None:
+            adjacency = self._build_weight_matrix(G)
+
         # Create Cluster objects
         clusters = []
         for cluster_id, members in communities.items():
-            cluster = self._create_cluster(cluster_id, members, G, modularity)
+            cluster = self._create_cluster(cluster_id, members, G, modularity, node_types)
 
             # Validate connectivity if enabled
             if self.validate_connectivity:
-                subclusters = self._validate_and_split_connectivity(cluster, G)
+                subclusters = self._validate_and_split_connectivity(cluster, G, adjacency)
                 clusters.extend(subclusters)
             else:
                 clusters.append(cluster)
 
         self.logger.info(f"Detected {len(clusters)} clusters")
 
+        # Score every final cluster in one pass over the shared weight matrix
+        self._calculate_metrics_for_clusters(clusters, G, adjacency)
+
         # Calculate advanced metrics if enabled
         if any(self.quality_metrics_config.values()):
-            self._calculate_advanced_metrics(clusters, G)
+            self._calculate_advanced_metrics(clusters, G, adjacency)
 
         return clusters
 
@@ -367,52 +416,56 @@ class ClusterDetector:
         feature_matrix = self.semantic_analyzer.normalize_features(features_dict)
 
         # Create mapping from method signature to feature index
-        methods = list(features_dict.keys())
-
-        # Copy graph
-        G_aug = G.copy()
-
-        # Calculate semantic similarities and add edges
-        from scipy.spatial.distance import euclidean
-
-        edges_augmented = 0
-        edges_weakened = 0
+        method_index = {method: i for i, method in enumerate(features_dict)}
+
+        # Only existing structural edges between two featured methods are reweighted
+        edge_pairs = []
+        rows = []
+        cols = []
+        for method1, method2 in G.edges():
+            i = method_index.get(method1)
+            j = method_index.get(method2)
+            if i is None or j is None or i == j:
+                continue
+            edge_pairs.append((method1, method2))
+            rows.append(i)
+            cols.append(j)
+
+        # Semantic similarity of just those pairs, not every method pair:
+        # 1 - euclidean distance normalized by the max possible distance
+        max_dist = np.sqrt(feature_matrix.shape[1])
+        semantic_sim = (
+            1.0 - np.linalg.norm(feature_matrix[rows] - feature_matrix[cols], axis=1) / max_dist
+        )
+        graph_weight = np.array([G[u][v]["weight"] for u, v in edge_pairs], dtype=np.float64)
+
+        # Reinforce: methods are structurally AND semantically similar
+        reinforced = semantic_sim >= self.semantic_threshold
+        # Weaken: structurally connected but semantically dissimilar
+        # This helps separate dissimilar methods even if they share some connection
+        weakening_factor = 0.9  # Reduce by 10%
+        new_weights = np.where(
+            reinforced,
+            self.hybrid_alpha * graph_weight + (1 - self.hybrid_alpha) * semantic_sim,
+            graph_weight * weakening_factor,
+        )
 
-        for i, method1 in enumerate(methods):
-            for j, method2 in enumerate(methods[i + 1 :], i + 1):
-                # Only process pairs that already have a structural edge
-                if not G_aug.has_edge(method1, method2):
-                    continue
-                    
-                # Calculate semantic similarity (1 - normalized euclidean distance)
-                dist = euclidean(feature_matrix[i], feature_matrix[j])
-                # Normalize distance to [0, 1]
-                max_dist = np.sqrt(feature_matrix.shape[1])  # Max possible Euclidean distance
-                semantic_sim = 1.0 - (dist / max_dist)
-
-                # Augment existing edge with hybrid weight
-                graph_weight = G_aug[method1][method2]["weight"]
-                
-                if semantic_sim >= self.semantic_threshold:
-                    # Reinforce: methods are structurally AND semantically similar
-                    hybrid_weight = (
-                        self.hybrid_alpha * graph_weight
-                        + (1 - self.hybrid_alpha) * semantic_sim
-                    )
-                    G_aug[method1][method2]["weight"] = hybrid_weight
-                    edges_augmented += 1
-                else:
-                    # Weaken: structurally connected but semantically dissimilar
-                    # This helps separate dissimilar methods even if they share some connection
-                    weakening_factor = 0.9  # Reduce by 10%
-                    G_aug[method1][method2]["weight"] = graph_weight * weakening_factor
-                    edges_weakened += 1
+        edges_augmented = int(reinforced.sum())
+        edges_weakened = len(edge_pairs) - edges_augmented
 
         self.logger.info(
             f"Semantic augmentation: {edges_augmented} edges reinforced, {edges_weakened} edges weakened "
             f"(alpha={self.hybrid_alpha:.2f}, threshold={self.semantic_threshold:.2f})"
         )
 
+        # The caller keeps using G, so new weights go on a copy, made only if needed
+        if not edge_pairs:
+            return G
+
+        G_aug = G.copy()
+        for (method1, method2), weight in zip(edge_pairs, new_weights.tolist(), strict=True):
+            G_aug[method1][method2]["weight"] = weight
+
         return G_aug
 
     def _semantic_clustering_fallback(self, class_deps: ClassDependencies) -> list[Cluster]:
@@ -483,18 +536,52 @@ class ClusterDetector:
             self.logger.warning(f"Semantic clustering failed: {e}")
             return []
 
-    def _detect_communities_louvain(self, G: nx.Graph, resolution: float) -> tuple[dict, float]:
-        """Run Louvain community detection."""
+    def _detect_communities_louvain(
+        self, G: nx.Graph, resolution: float, ig_graph: "ig.Graph | None" = None
+    ) -> tuple[dict, float]:
+        """
+        Run Louvain community detection.
+
+        Uses igraph's C implementation when installed, unless the
+        ``louvain_backend`` setting asks for python-louvain to reproduce
+        partitions from earlier runs.
+        """
+        if self._louvain_uses_igraph():
+            return self._detect_communities_louvain_igraph(G, resolution, ig_graph)
+
         partition = community_louvain.best_partition(
             G, weight="weight", resolution=resolution, random_state=self.seed
         )
         modularity = community_louvain.modularity(partition, G, weight="weight")
         return partition, modularity
 
-    def _detect_communities_leiden(self, G: nx.Graph, resolution: float) -> tuple[dict, float]:
+    def _detect_communities_louvain_igraph(
+        self, G: nx.Graph, resolution: float, ig_graph: "ig.Graph | None" = None
+    ) -> tuple[dict, float]:
+        """Run igraph's multilevel (Louvain) community detection."""
+        if ig_graph is None:
+            ig_graph = self._networkx_to_igraph(G)
+
+        # igraph draws from a process-wide RNG; seed a private one for this run
+        ig.set_random_number_generator(random.Random(self.seed))
+        try:
+            membership = ig_graph.community_multilevel(
+                weights="weight", resolution=resolution
+            ).membership
+        finally:
+            ig.set_random_number_generator(random)
+
+        partition = dict(zip(G.nodes(), membership, strict=True))
+        modularity = ig_graph.modularity(membership, weights="weight")
+        return partition, modularity
+
+    def _detect_communities_leiden(
+        self, G: nx.Graph, resolution: float, ig_graph: "ig.Graph | None" = None
+    ) -> tuple[dict, float]:
         """Run Leiden community detection (guaranteed connected communities)."""
         # Convert NetworkX graph to igraph
-        ig_graph = self._networkx_to_igraph(G)
+        if ig_graph is None:
+            ig_graph = self._networkx_to_igraph(G)
 
         # Run Leiden algorithm
         partition = leidenalg.find_partition(
@@ -515,15 +602,26 @@ class ClusterDetector:
         modularity = partition.quality()
         return partition_dict, modularity
 
+    def _uses_igraph(self) -> bool:
+        """Whether the configured community detection runs on an igraph copy."""
+        return self.algorithm == "leiden" or self._louvain_uses_igraph()
+
+    def _louvain_uses_igraph(self) -> bool:
+        """Whether Louvain runs on igraph rather than python-louvain."""
+        return IGRAPH_AVAILABLE and self.louvain_backend == "igraph"
+
     def _networkx_to_igraph(self, G: nx.Graph) -> "ig.Graph":
         """Convert NetworkX graph to igraph format."""
         # Create mapping from node names to indices
         node_list = list(G.nodes())
         node_to_idx = {node: idx for idx, node in enumerate(node_list)}
 
-        # Create edge list with indices
-        edges = [(node_to_idx[u], node_to_idx[v]) for u, v in G.edges()]
-        weights = [G[u][v]["weight"] for u, v in G.edges()]
+        # Create edge list with indices and weights in one edge walk
+        edges = []
+        weights = []
+        for u, v, weight in G.edges(data="weight", default=1.0):
+            edges.append((node_to_idx[u], node_to_idx[v]))
+            weights.append(weight)
 
         # Create igraph
         ig_graph = ig.Graph(n=len(node_list), edges=edges, directed=False)
@@ -532,40 +630,52 @@ class ClusterDetector:
         return ig_graph
 
     def _create_cluster(
-        self, cluster_id: int, members: list[str], G: nx.Graph, modularity: float
+        self,
+        cluster_id: int,
+        members: list[str],
+        G: nx.Graph,
+        modularity: float,
+        node_types: dict[str, str] | None = None,
     ) -> Cluster:
-        """Create a Cluster object from community members."""
+        """Create a Cluster object from community members (metrics are filled in later)."""
         # Get member types from graph
-        member_types = {}
-        for member in members:
-            node_type = G.nodes[member].get("type", "method")
-            member_types[member] = node_type
+        if node_types is None:
+            node_types = dict(G.nodes(data="type", default="method"))
+        member_types = {member: node_types[member] for member in members}
 
-        cluster = Cluster(
+        return Cluster(
             id=cluster_id, member_names=members, member_types=member_types, modularity=modularity
         )
 
-        # Calculate basic cluster quality metrics
-        self._calculate_cluster_metrics(cluster, G)
-
-        return cluster
-
-    def _validate_and_split_connectivity(self, cluster: Cluster, G: nx.Graph) -> list[Cluster]:
+    def _validate_and_split_connectivity(
+        self, cluster: Cluster, G: nx.Graph, adjacency: tuple | None = None
+    ) -> list[Cluster]:
         """
         Validate cluster connectivity and split if disconnected.
 
+        Sub-clusters carry no cohesion/coupling metrics; the caller computes
+        them for all final clusters at once. Components keep the cluster's
+        member order and are numbered by their first member.
+
         Args:
             cluster: Cluster to validate
             G: Full graph
+            adjacency: Prebuilt weight matrix of G from _build_weight_matrix
 
         Returns:
             List of clusters (original if connected, split components if disconnected)
         """
-        # Get subgraph induced by cluster members
-        subgraph = G.subgraph(cluster.member_names)
+        # Label components on the induced block of the CSR weight matrix
+        weights, index = adjacency if adjacency is not None else self._build_weight_matrix(G)
+        member_idx = np.fromiter(
+            (index[m] for m in cluster.member_names), dtype=np.intp, count=len(cluster.member_names)
+        )
+        n_components, labels = csgraph.connected_components(
+            weights[member_idx][:, member_idx], directed=False
+        )
 
         # Check connectivity
-        if nx.is_connected(subgraph):
+        if n_components == 1:
             cluster.is_connected = True
             return [cluster]
 
@@ -578,7 +688,9 @@ class ClusterDetector:
             )
             return [cluster]
 
-        components = list(nx.connected_components(subgraph))
+        components: list[list[str]] = [[] for _ in range(n_components)]
+        for member, label in zip(cluster.member_names, labels.tolist(), strict=True):
+            components[label].append(member)
         self.logger.warning(
             f"Cluster {cluster.id} is disconnected! Splitting into {len(components)} "
             f"connected components"
@@ -586,8 +698,7 @@ class ClusterDetector:
 
         # Create sub-clusters from connected components
         subclusters = []
-        for comp_idx, component in enumerate(components):
-            members = list(component)
+        for comp_idx, members in enumerate(components):
             member_types = {m: cluster.member_types[m] for m in members}
 
             subcluster = Cluster(
@@ -597,9 +708,6 @@ class ClusterDetector:
                 modularity=cluster.modularity,
                 is_connected=True,
             )
-
-            # Recalculate metrics for subcluster
-            self._calculate_cluster_metrics(subcluster, G)
             subclusters.append(subcluster)
 
         return subclusters
@@ -627,14 +735,45 @@ class ClusterDetector:
         best_score = -float("inf")
         best_resolution = None
 
-        for resolution in resolution_range:
-            clusters = self._detect_communities(G, resolution)
+        # Convert the graph once for every resolution in the sweep
+        ig_graph = self._networkx_to_igraph(G) if self._uses_igraph() else None
+        adjacency = self._build_weight_matrix(G)
 
+        # Graph distances depend only on G; unless sampling kicks in, every
+        # resolution scores the same nodes, so compute them once
+        distances = None
+        if quality_metric == "silhouette" and G.number_of_nodes() <= self.silhouette_sample_size:
+            distances = self._graph_distance_matrix(list(G.nodes()), G, adjacency)
+
+        # Resolutions are independent, so they can be clustered in worker processes
+        if self.multi_resolution_config.get("parallel", False) and len(resolution_range) > 1:
+            max_workers = self.multi_resolution_config.get("max_workers") or min(
+                len(resolution_range), multiprocessing.cpu_count()
+            )
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                sweep = list(
+                    executor.map(
+                        self._detect_communities,
+                        repeat(G),
+                        resolution_range,
+                        repeat(ig_graph),
+                        repeat(adjacency),
+                    )
+                )
+        else:
+            sweep = (
+                self._detect_communities(G, resolution, ig_graph, adjacency)
+                for resolution in resolution_range
+            )
+
+        for resolution, clusters in zip(resolution_range, sweep, strict=True):
             # Calculate quality score
             if quality_metric == "modularity" and clusters:
                 score = clusters[0].modularity
             elif quality_metric == "silhouette" and len(clusters) > 1:
-                score = self._calculate_silhouette_score_for_clustering(clusters, G)
+                score = self._calculate_silhouette_score_for_clustering(
+                    clusters, G, adjacency, distances
+                )
             else:
                 score = 0.0
 
@@ -676,48 +815,71 @@ class ClusterDetector:
         # Co-occurrence matrix
         cooccurrence = np.zeros((n, n))
 
+        # Perturb one weight array per run; the topology never changes, so the
+        # igraph copy (or a single graph copy for python-louvain) and the weight
+        # matrix used for connectivity checks are built once
+        base_weights = np.fromiter(
+            (weight for _, _, weight in G.edges(data="weight", default=1.0)),
+            dtype=np.float64,
+            count=G.number_of_edges(),
+        )
+        rng = np.random.default_rng(self.seed)
+        ig_graph = self._networkx_to_igraph(G) if self._uses_igraph() else None
+        G_perturbed = G if ig_graph is not None else G.copy()
+        adjacency = self._build_weight_matrix(G)
+
+        # Add randomness by perturbing edge weights slightly; drawn in order, so
+        # parallel runs see the same perturbations as serial ones
+        perturbations = (
+            np.maximum(0.01, base_weights + rng.normal(0.0, 0.1 * base_weights))
+            for _ in range(iterations)
+        )
+
         # Run clustering multiple times
-        for i in range(iterations):
-            # Add randomness by perturbing edge weights slightly
-            G_perturbed = G.copy()
-            for u, v in G_perturbed.edges():
-                weight = G_perturbed[u][v]["weight"]
-                noise = np.random.normal(0, 0.1 * weight)
-                G_perturbed[u][v]["weight"] = max(0.01, weight + noise)
-
-            # Detect communities
-            clusters = self._detect_communities(G_perturbed, self.resolution)
-
-            # Update co-occurrence matrix
-            for cluster in clusters:
-                members = cluster.member_names
-                for m1 in members:
-                    for m2 in members:
-                        if m1 != m2:
-                            idx1 = node_to_idx[m1]
-                            idx2 = node_to_idx[m2]
-                            cooccurrence[idx1][idx2] += 1
+        if self.stability_config.get("parallel", False) and iterations > 1:
+            max_workers = self.stability_config.get("max_workers") or min(
+                iterations, multiprocessing.cpu_count()
+            )
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                runs = list(
+                    executor.map(
+                        self._cluster_perturbed,
+                        repeat(G_perturbed),
+                        perturbations,
+                        repeat(ig_graph),
+                        repeat(adjacency),
+                    )
+                )
+        else:
+            runs = (
+                self._cluster_perturbed(G_perturbed, weights, ig_graph, adjacency)
+                for weights in perturbations
+            )
+
+        for memberships in runs:
+            # Update co-occurrence matrix: one block per cluster
+            for members in memberships:
+                idx = [node_to_idx[m] for m in members]
+                cooccurrence[np.ix_(idx, idx)] += 1
+
+        # A node always co-occurs with itself; only pairs count
+        np.fill_diagonal(cooccurrence, 0)
 
         # Normalize
         cooccurrence /= iterations
 
-        # Threshold to create consensus graph
-        consensus_edges = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                if cooccurrence[i][j] >= threshold:
-                    consensus_edges.append((nodes[i], nodes[j], cooccurrence[i][j]))
+        # Threshold to create consensus graph (upper triangle, row-major order)
+        rows, cols = np.nonzero(np.triu(cooccurrence >= threshold, k=1))
 
         # Build consensus graph
         G_consensus = nx.Graph()
         G_consensus.add_nodes_from(nodes)
-        for u, v, weight in consensus_edges:
-            G_consensus.add_edge(u, v, weight=weight)
-            # Copy node attributes
-            for node in [u, v]:
-                if node in G.nodes:
-                    for attr, value in G.nodes[node].items():
-                        G_consensus.nodes[node][attr] = value
+        G_consensus.add_weighted_edges_from(
+            (nodes[i], nodes[j], cooccurrence[i, j]) for i, j in zip(rows, cols, strict=True)
+        )
+        # Copy node attributes of nodes that gained an edge
+        for idx in np.union1d(rows, cols):
+            G_consensus.nodes[nodes[idx]].update(G.nodes[nodes[idx]])
 
         # Cluster the consensus graph
         if G_consensus.number_of_edges() > 0:
@@ -725,17 +887,12 @@ class ClusterDetector:
 
             # Calculate stability scores
             for cluster in clusters:
-                members = cluster.member_names
-                if len(members) > 1:
-                    # Average co-occurrence within cluster
-                    scores = []
-                    for m1 in members:
-                        for m2 in members:
-                            if m1 != m2:
-                                idx1 = node_to_idx[m1]
-                                idx2 = node_to_idx[m2]
-                                scores.append(cooccurrence[idx1][idx2])
-                    cluster.stability_score = np.mean(scores) if scores else 0.0
+                size = len(cluster.member_names)
+                if size > 1:
+                    # Average co-occurrence over ordered member pairs (diagonal is zero)
+                    idx = [node_to_idx[m] for m in cluster.member_names]
+                    pair_total = cooccurrence[np.ix_(idx, idx)].sum()
+                    cluster.stability_score = float(pair_total / (size * (size - 1)))
                 else:
                     cluster.stability_score = 1.0
 
@@ -747,14 +904,61 @@ class ClusterDetector:
 
         return clusters
 
+    def _cluster_perturbed(
+        self,
+        G: nx.Graph,
+        weights: np.ndarray,
+        ig_graph: "ig.Graph | None" = None,
+        adjacency: tuple | None = None,
+    ) -> list[list[str]]:
+        """
+        Run one consensus iteration on perturbed edge weights.
+
+        The weights are written into ``ig_graph`` when given, otherwise into
+        the edge data of ``G`` itself, so callers pass a copy they own.
+
+        Args:
+            G: Graph to cluster
+            weights: Edge weights in ``G.edges()`` order
+            ig_graph: Prebuilt igraph copy of G
+            adjacency: Prebuilt weight matrix of G for connectivity checks
+
+        Returns:
+            Members of each detected cluster
+        """
+        if ig_graph is not None:
+            ig_graph.es["weight"] = weights.tolist()
+        else:
+            for (_, _, data), weight in zip(G.edges(data=True), weights.tolist(), strict=True):
+                data["weight"] = weight
+
+        clusters = self._detect_communities(G, self.resolution, ig_graph, adjacency)
+        return [cluster.member_names for cluster in clusters]
+
     def _calculate_silhouette_score_for_clustering(
-        self, clusters: list[Cluster], G: nx.Graph
+        self,
+        clusters: list[Cluster],
+        G: nx.Graph,
+        adjacency: tuple | None = None,
+        distances: np.ndarray | None = None,
     ) -> float:
-        """Calculate average silhouette score for entire clustering."""
+        """
+        Calculate average silhouette score for entire clustering.
+
+        Args:
+            clusters: Clusters to score
+            G: Full graph
+            adjacency: Precomputed weight matrix from _build_weight_matrix (optional)
+            distances: Precomputed distances between all nodes of G, in the
+                node order of ``adjacency`` (optional)
+
+        Returns:
+            Mean silhouette score, or 0.0 when it is undefined
+        """
         if not SKLEARN_AVAILABLE or len(clusters) < 2:
             return 0.0
 
-        # Create feature matrix and labels
+        # Collect nodes and labels
         nodes = []
         labels = []
         for cluster in clusters:
@@ -765,16 +969,57 @@ class ClusterDetector:
         if len(set(labels)) < 2:
             return 0.0
 
-        features = self._create_feature_matrix(nodes, G)
+        nodes, labels = self._sample_for_silhouette(nodes, labels)
+        if distances is not None:
+            node_index = (adjacency or self._build_weight_matrix(G))[1]
+            rows = [node_index[node] for node in nodes]
+            distances = distances[np.ix_(rows, rows)]
+        else:
+            distances = self._graph_distance_matrix(nodes, G, adjacency)
 
         try:
-            score = silhouette_score(features, labels)
+            score = silhouette_score(distances, labels, metric="precomputed")
             return score
         except Exception as e:
             self.logger.debug(f"Could not calculate silhouette score: {e}")
             return 0.0
 
-    def _calculate_advanced_metrics(self, clusters: list[Cluster], G: nx.Graph):
+    def _sample_for_silhouette(
+        self, nodes: list[str], labels: list[int]
+    ) -> tuple[list[str], list[int]]:
+        """
+        Subsample nodes for silhouette scoring on large clusterings.
+
+        Silhouette needs all pairwise distances between the scored nodes, so
+        past ``silhouette_sample_size`` nodes it is estimated on a seeded
+        sample instead. The sample holds one random member of every cluster,
+        topped up with a uniform draw from the remaining nodes.
+
+        Args:
+            nodes: Clustered nodes
+            labels: Cluster id of each node
+
+        Returns:
+            The (nodes, labels) to score, in their original order
+        """
+        if len(nodes) <= self.silhouette_sample_size:
+            return nodes, labels
+
+        rng = np.random.default_rng(self.seed)
+        order = rng.permutation(len(nodes))
+        _, first = np.unique(np.asarray(labels)[order], return_index=True)
+        representatives = order[first]
+        rest = np.setdiff1d(order, representatives)
+        extra = rng.choice(
+            rest, max(self.silhouette_sample_size - len(representatives), 0), replace=False
+        )
+        keep = np.sort(np.concatenate([representatives, extra])).tolist()
+
+        return [nodes[i] for i in keep], [labels[i] for i in keep]
+
+    def _calculate_advanced_metrics(
+        self, clusters: list[Cluster], G: nx.Graph, adjacency: tuple | None = None
+    ):
         """Calculate advanced quality metrics for clusters."""
         if not any(self.quality_metrics_config.values()):
             return
@@ -790,13 +1035,13 @@ class ClusterDetector:
                         labels.append(cluster.id)
 
                 if len(set(labels)) > 1:
-                    features = self._create_feature_matrix(nodes, G)
+                    # Members left out of a large sample do not count towards their cluster's mean
+                    nodes, labels = self._sample_for_silhouette(nodes, labels)
+                    distances = self._graph_distance_matrix(nodes, G, adjacency)
 
                     try:
                         # Calculate per-sample silhouette scores
-                        from sklearn.metrics import silhouette_samples
-
-                        sample_scores = silhouette_samples(features, labels)
+                        sample_scores = silhouette_samples(distances, labels, metric="precomputed")
 
                         # Assign scores to clusters
                         node_to_score = {
@@ -806,80 +1051,80 @@ class ClusterDetector:
                             scores = [
                                 node_to_score[m] for m in cluster.member_names if m in node_to_score
                             ]
-                            cluster.silhouette_score = np.mean(scores) if scores else None
+                            cluster.silhouette_score = sum(scores) / len(scores) if scores else None
                     except Exception as e:
                         self.logger.debug(f"Could not calculate silhouette scores: {e}")
 
         # Conductance
         if self.quality_metrics_config.get("conductance", False):
+            adjacency = adjacency or self._build_weight_matrix(G)
             for cluster in clusters:
-                cluster.conductance = self._calculate_conductance(cluster, G)
+                cluster.conductance = self._calculate_conductance(cluster, G, adjacency)
 
         # Coverage
         if self.quality_metrics_config.get("coverage", False):
             total_edges = G.number_of_edges()
             if total_edges > 0:
-                internal_edges = sum(
-                    len(
-                        [
-                            (u, v)
-                            for u in cluster.member_names
-                            for v in cluster.member_names
-                            if u < v and G.has_edge(u, v)
-                        ]
-                    )
-                    for cluster in clusters
-                )
+                # Internal edge counts from one pass over the edges, not a member-pair scan
+                adjacency = adjacency or self._build_weight_matrix(G)
+                internal_edges = int(self._accumulate_edge_stats(clusters, adjacency)[1].sum())
                 coverage = internal_edges / total_edges
                 for cluster in clusters:
                     cluster.coverage = coverage
 
-    def _create_feature_matrix(self, nodes: list[str], G: nx.Graph) -> np.ndarray:
-        """Create feature matrix for silhouette score calculation."""
-        features = []
-        for node in nodes:
-            # Features: degree, clustering coefficient, avg neighbor degree
-            degree = G.degree(node, weight="weight")
-            clustering_coef = nx.clustering(G, node, weight="weight")
-
-            # Average neighbor degree
-            neighbors = list(G.neighbors(node))
-            if neighbors:
-                avg_neighbor_degree = np.mean([G.degree(n, weight="weight") for n in neighbors])
-            else:
-                avg_neighbor_degree = 0.0
+    def _graph_distance_matrix(
+        self, nodes: list[str], G: nx.Graph, adjacency: tuple | None = None
+    ) -> np.ndarray:
+        """
+        Create the pairwise distance matrix for silhouette score calculation.
 
-            features.append([degree, clustering_coef, avg_neighbor_degree])
+        Distances are shortest-path hop counts in the graph, found by one
+        breadth-first search per node over the CSR weight matrix. Edge weights
+        are coupling strengths rather than lengths, so they only decide which
+        edges exist. Nodes in different components are placed at twice the
+        largest finite distance.
 
-        # Normalize features
-        features = np.array(features)
-        if SKLEARN_AVAILABLE:
-            scaler = StandardScaler()
-            features = scaler.fit_transform(features)
+        Args:
+            nodes: Nodes to return distances for, in row and column order
+            G: Full graph
+            adjacency: Precomputed weight matrix from _build_weight_matrix (optional)
 
-        return features
+        Returns:
+            Symmetric distance matrix with one row and column per node
+        """
+        weights, node_index = adjacency or self._build_weight_matrix(G)
+        rows = np.fromiter((node_index[node] for node in nodes), dtype=np.intp, count=len(nodes))
+
+        distances = csgraph.shortest_path(weights, directed=False, unweighted=True, indices=rows)
+        distances = distances[:, rows]
 
-    def _calculate_conductance(self, cluster: Cluster, G: nx.Graph) -> float:
+        unreachable = np.isinf(distances)
+        if unreachable.any():
+            finite_max = distances[~unreachable].max(initial=0.0)
+            distances[unreachable] = 2 * max(finite_max, 1.0)
+
+        return distances
+
+    def _calculate_conductance(
+        self, cluster: Cluster, G: nx.Graph, adjacency: tuple | None = None
+    ) -> float:
         """
         Calculate conductance: ratio of cut edges to min volume.
 
         Lower conductance = better cluster (fewer boundary edges).
         """
-        members = set(cluster.member_names)
-
-        # Count cut edges and internal volume
-        cut_weight = 0.0
-        internal_volume = 0.0
-        external_volume = 0.0
-
-        for node in members:
-            for neighbor in G.neighbors(node):
-                weight = G[node][neighbor]["weight"]
-                if neighbor in members:
-                    internal_volume += weight
-                else:
-                    cut_weight += weight
-                    external_volume += weight
+        weights, node_index = adjacency or self._build_weight_matrix(G)
+        idx = np.fromiter(
+            (node_index[m] for m in cluster.member_names if m in node_index), dtype=np.intp
+        )
+
+        # Split each member row by neighbour side; internal edges count from both ends
+        inside = np.zeros(weights.shape[0])
+        inside[idx] = 1.0
+        rows = weights[idx]
+        internal_volume = (rows @ inside).sum()
+        cut_weight = (rows @ (1.0 - inside)).sum()
+        external_volume = cut_weight
 
         # Avoid division by zero
         if internal_volume == 0 and external_volume == 0:
@@ -914,32 +1159,40 @@ class ClusterDetector:
 
             extraction_validator = ExtractionValidator()
 
+        # Thresholds are the same for every cluster; read them once
+        total_methods = (
+            len(class_deps.methods)
+            if class_deps and hasattr(class_deps, "methods") and class_deps.methods
+            else 0
+        )
+        min_quality = self.quality_metrics_config.get("min_quality_score", 0.0)
+
         filtered = []
         for cluster in clusters:
             # Check size constraints
-            if len(cluster) < self.min_cluster_size:
+            size = len(cluster)
+            if size < self.min_cluster_size:
                 self.logger.debug(
-                    f"Cluster {cluster.id} too small ({len(cluster)} < {self.min_cluster_size})"
+                    f"Cluster {cluster.id} too small ({size} < {self.min_cluster_size})"
                 )
                 continue
 
-            if len(cluster) > self.max_cluster_size:
+            if size > self.max_cluster_size:
                 self.logger.debug(
-                    f"Cluster {cluster.id} too large ({len(cluster)} > {self.max_cluster_size})"
+                    f"Cluster {cluster.id} too large ({size} > {self.max_cluster_size})"
                 )
                 continue
 
+            cluster_methods = len(cluster.get_methods())
+
             # Reject degenerate extractions: if a cluster contains >=80% of all
             # methods, it's a class rename not a meaningful Extract Class.
-            if class_deps and hasattr(class_deps, 'methods') and class_deps.methods:
-                total_methods = len(class_deps.methods)
-                cluster_methods = len(cluster.get_methods())
-                if total_methods > 0 and cluster_methods / total_methods >= 0.8:
-                    self.logger.info(
-                        f"Cluster {cluster.id} rejected: contains {cluster_methods}/{total_methods} "
-                        f"methods ({cluster_methods*100//total_methods}%) — would be a rename, not extraction"
-                    )
-                    continue
+            if total_methods > 0 and cluster_methods / total_methods >= 0.8:
+                self.logger.info(
+                    f"Cluster {cluster.id} rejected: contains {cluster_methods}/{total_methods} "
+                    f"methods ({cluster_methods*100//total_methods}%) — would be a rename, not extraction"
+                )
+                continue
 
             # Check cohesion constraint (skip for fallback clusters with zero modularity)
             # Fallback clusters are created when graph has no edges
@@ -951,7 +1204,6 @@ class ClusterDetector:
                 continue
 
             # Quality score pre-filter (NEW)
-            min_quality = self.quality_metrics_config.get("min_quality_score", 0.0)
             if min_quality > 0 and cluster.quality_score < min_quality:
                 self.logger.debug(
                     f"Cluster {cluster.id} quality too low "
@@ -960,7 +1212,7 @@ class ClusterDetector:
                 continue
 
             # Must have at least one method
-            if len(cluster.get_methods()) == 0:
+            if cluster_methods == 0:
                 self.logger.debug(f"Cluster {cluster.id} has no methods")
                 continue
 
@@ -988,7 +1240,7 @@ class ClusterDetector:
 
         return filtered
 
-    def rank_clusters(self, clusters: list[Cluster]) -> list[Cluster]:
+    def rank_clusters(self, clusters: list[Cluster], top_k: int | None = None) -> list[Cluster]:
         """
         Rank clusters by quality score.
 
@@ -1002,6 +1254,8 @@ class ClusterDetector:
 
         Args:
             clusters: List of clusters to rank
+            top_k: Only return the best ``top_k`` clusters (None = all). Every
+                cluster still gets its ``rank_score``.
 
         Returns:
             Sorted list of clusters (best first)
@@ -1030,8 +1284,11 @@ class ClusterDetector:
 
             cluster.rank_score = rank_score
 
-        # Sort by rank score (descending)
-        ranked = sorted(clusters, key=lambda c: c.rank_score, reverse=True)
+        # Sort by rank score (descending); a bounded heap suffices for top-k
+        if top_k is None:
+            ranked = sorted(clusters, key=lambda c: c.rank_score, reverse=True)
+        else:
+            ranked = heapq.nlargest(top_k, clusters, key=lambda c: c.rank_score)
 
         for i, cluster in enumerate(ranked, 1):
             metrics = [
@@ -1070,8 +1327,7 @@ class ClusterDetector:
         cluster_fields = set(cluster.get_fields())
 
         # Get all methods and fields in the class
-        all_methods = {m.signature for m in class_deps.get_all_methods()}
-        all_fields = {f.name for f in class_deps.fields}
+        all_methods, all_fields = self._index_members(class_deps)
 
         # Check that cluster members exist
         for method in cluster_methods:
@@ -1098,37 +1354,127 @@ class ClusterDetector:
 
         return True
 
-    def _calculate_cluster_metrics(self, cluster: Cluster, G: nx.Graph):
+    @staticmethod
+    def _build_weight_matrix(G: nx.Graph) -> tuple:
+        """
+        Build a CSR matrix of edge weights for per-cluster metric slicing.
+
+        Args:
+            G: Full graph
+
+        Returns:
+            Tuple of (symmetric CSR weight matrix, node name -> row index)
         """
-        Calculate quality metrics for a cluster (OPTIMIZED VERSION).
+        nodes = list(G.nodes())
+        weights = nx.to_scipy_sparse_array(
+            G, nodelist=nodes, dtype=np.float64, weight="weight", format="csr"
+        )
+        return weights, {node: idx for idx, node in enumerate(nodes)}
+
+    def _index_members(self, class_deps: ClassDependencies) -> tuple[set[str], set[str]]:
+        """
+        Collect the class's method signatures and field names, once per class.
+
+        Args:
+            class_deps: Class dependencies shared by the clusters being validated
+
+        Returns:
+            Tuple of (method signatures, field names)
+        """
+        if self._indexed_deps is not class_deps:
+            self._indexed_deps = class_deps
+            self._member_index = (
+                {m.signature for m in class_deps.get_all_methods()},
+                {f.name for f in class_deps.fields},
+            )
+        return self._member_index
+
+    def _calculate_cluster_metrics(
+        self, cluster: Cluster, G: nx.Graph, adjacency: tuple | None = None
+    ):
+        """
+        Calculate quality metrics for a single cluster.
 
         Args:
             cluster: Cluster to analyze
             G: Full graph
+            adjacency: Precomputed weight matrix from _build_weight_matrix (optional)
         """
-        members = set(cluster.member_names)
+        self._calculate_metrics_for_clusters([cluster], G, adjacency)
 
-        # OPTIMIZATION: Use subgraph instead of nested loops
-        subgraph = G.subgraph(members)
+    def _calculate_metrics_for_clusters(
+        self, clusters: list[Cluster], G: nx.Graph, adjacency: tuple | None = None
+    ):
+        """
+        Calculate quality metrics for disjoint clusters of one graph.
 
-        # Calculate internal cohesion (average weight of internal edges)
-        if subgraph.number_of_edges() > 0:
-            internal_weights = [subgraph[u][v]["weight"] for u, v in subgraph.edges()]
-            cluster.internal_cohesion = np.mean(internal_weights)
-        else:
-            cluster.internal_cohesion = 0.0
+        Args:
+            clusters: Clusters to analyze (no node may belong to two of them)
+            G: Full graph
+            adjacency: Precomputed weight matrix from _build_weight_matrix (optional)
+        """
+        stats = self._accumulate_edge_stats(clusters, adjacency or self._build_weight_matrix(G))
+        for pos, cluster in enumerate(clusters):
+            self._finalize_cluster_metrics(cluster, *(column[pos] for column in stats))
 
-        # Calculate external coupling (average weight of edges to outside)
-        external_edges = []
-        for u in members:
-            for v in G.neighbors(u):
-                if v not in members:
-                    external_edges.append(G[u][v]["weight"])
+    @staticmethod
+    def _accumulate_edge_stats(clusters: list[Cluster], adjacency: tuple) -> tuple:
+        """
+        Tally internal and external edge weights for every cluster in one edge pass.
 
-        if external_edges:
-            cluster.external_coupling = np.mean(external_edges)
-        else:
-            cluster.external_coupling = 0.0
+        Each undirected edge is visited once and routed by the clusters of its
+        endpoints: to its cluster's internal tally when both ends agree,
+        otherwise to the external tally of each endpoint's cluster.
+
+        Args:
+            clusters: Disjoint clusters to tally
+            adjacency: Weight matrix from _build_weight_matrix
+
+        Returns:
+            Tuple of (internal_sum, internal_count, external_sum, external_count)
+            arrays indexed by position in ``clusters``
+        """
+        weights, node_index = adjacency
+        labels = np.full(weights.shape[0], -1, dtype=np.intp)
+        for pos, cluster in enumerate(clusters):
+            labels[[node_index[m] for m in cluster.member_names if m in node_index]] = pos
+
+        edges = sparse.triu(weights, format="coo")
+        source, target = labels[edges.row], labels[edges.col]
+        internal = (source == target) & (source >= 0)
+        n = len(clusters)
+
+        def tally(owners, mask):
+            keep = mask & (owners >= 0)
+            return (
+                np.bincount(owners[keep], weights=edges.data[keep], minlength=n),
+                np.bincount(owners[keep], minlength=n),
+            )
+
+        internal_sum, internal_count = tally(source, internal)
+        source_sum, source_count = tally(source, ~internal)
+        target_sum, target_count = tally(target, ~internal)
+        return (
+            internal_sum,
+            internal_count,
+            source_sum + target_sum,
+            source_count + target_count,
+        )
+
+    @staticmethod
+    def _finalize_cluster_metrics(
+        cluster: Cluster,
+        internal_sum: float,
+        internal_count: int,
+        external_sum: float,
+        external_count: int,
+    ):
+        """Derive cohesion, coupling and their combined score from edge tallies."""
+        # Internal cohesion: average weight of internal edges
+        cluster.internal_cohesion = float(internal_sum / internal_count) if internal_count else 0.0
+
+        # External coupling: average weight of edges to outside
+        cluster.external_coupling = float(external_sum / external_count) if external_count else 0.0
 
         # Normalize external coupling to [0, 1]
         if cluster.internal_cohesion > 0:
@@ -1184,8 +1530,7 @@ class ClusterDetector:
         member_types = {}
         methods = []
         fields = []
-        for node in nodes:
-            node_type = G.nodes[node].get("type", "method")
+        for node, node_type in G.nodes(data="type", default="method"):
             member_types[node] = node_type
             if node_type == "method":
                 methods.append(node)
@@ -1233,19 +1578,10 @@ class ClusterDetector:
         pattern_config = self.clustering_config.get("clustering_patterns", [])
 
         # Build pattern list from config or use defaults
+        prefix_re = None
         if pattern_config:
             prefixes = [p["prefix"] for p in pattern_config]
-            pattern_str = "|".join(prefixes)
-        else:
-            # Default patterns
-            pattern_str = (
-                "is|has|get|set|contains?|starts?|ends?|split|join|strip|trim|pad|"
-                "remove|replace|substring|index|count|check|validate|find|search|"
-                "parse|format|convert|to|from|create|build|add|append|prepend|insert|"
-                "delete|truncate|wrap|unwrap|escape|unescape|encode|decode|normalize|"
-                "compare|equals?|matches?|empty|blank|null|default|abbreviate|"
-                "capitalize|center|chop|reverse|rotate|swap|overlay|repeat|difference"
-            )
+            prefix_re = re.compile(f"^({'|'.join(prefixes)})[A-Z]")
 
         # Group methods by common prefixes/patterns
         groups = defaultdict(list)
@@ -1253,18 +1589,25 @@ class ClusterDetector:
         for method in methods:
             # Extract prefix
             method_name = method.split("(", 1)[0] if "(" in method else method
-            prefix_match = re.match(f"^({pattern_str})[A-Z]", method_name)
-
-            if prefix_match:
-                prefix = prefix_match.group(1)
+            first_word = _CAMEL_WORD_RE.search(method_name)
+
+            prefix = None
+            if prefix_re is not None:
+                prefix_match = prefix_re.match(method_name)
+                if prefix_match:
+                    prefix = prefix_match.group(1)
+            elif first_word:
+                head = method_name[: first_word.start()]
+                if head in _DEFAULT_PREFIXES:
+                    prefix = head
+
+            if prefix is not None:
                 groups[prefix].append(method)
-            else:
+            elif first_word:
                 # No clear prefix, use first word
-                words = re.findall(r"[A-Z][a-z]*", method_name)
-                if words:
-                    groups[words[0].lower()].append(method)
-                else:
-                    groups["other"].append(method)
+                groups[first_word.group().lower()].append(method)
+            else:
+                groups["other"].append(method)
 
         # Create clusters from groups
         clusters = []
@@ -1274,13 +1617,12 @@ class ClusterDetector:
             if len(group_methods) < self.min_cluster_size:
                 continue
 
-            cluster_members = list(group_methods)
-
-            cluster_member_types = {name: member_types[name] for name in cluster_members}
+            # Each group list is local to this call, so it can back the cluster directly
+            cluster_member_types = {name: member_types[name] for name in group_methods}
 
             cluster = Cluster(
                 id=cluster_id,
-                member_names=cluster_members,
+                member_names=group_methods,
                 member_types=cluster_member_types,
                 modularity=0.0,
                 internal_cohesion=0.0,
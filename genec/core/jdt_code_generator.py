@@ -29,6 +29,7 @@ from pathlib import Path
 from genec.core.models import Cluster
 from genec.core.dependency_analyzer import ClassDependencies
 from genec.utils.logging_utils import get_logger
+from genec.utils.paths import get_project_root
 
 
 class CodeGenerationError(Exception):
@@ -98,7 +99,7 @@ class JDTCodeGenerator:
 
     def _find_jdt_wrapper(self) -> str:
         """Find JDT wrapper JAR in default locations."""
-        project_root = Path(__file__).parent.parent.parent
+        project_root = get_project_root()
         user_home = Path.home()
 
         # Standard user location
@@ -332,11 +332,10 @@ class LLMInterface:
         # Round 2: Critique and refine
         from genec.core.prompts import CRITIQUE_PROMPT_TEMPLATE
 
-        cluster_members = "\n".join(
-            [f"- {m}" for m in cluster.get_methods()[:10]]
-        )  # Limit to 10 for brevity
-        if len(cluster.get_methods()) > 10:
-            cluster_members += f"\n... and {len(cluster.get_methods()) - 10} more"
+        methods = cluster.get_methods()
+        cluster_members = "\n".join([f"- {m}" for m in methods[:10]])  # Limit to 10 for brevity
+        if len(methods) > 10:
+            cluster_members += f"\n... and {len(methods) - 10} more"
 
         critique_prompt = CRITIQUE_PROMPT_TEMPLATE.format(
             class_name=suggestion_v1.proposed_class_name,
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
 
 
 class QualityTier(Enum):
@@ -19,9 +20,12 @@ class QualityTier(Enum):
     POTENTIAL = "potential"  # Low quality - informational only
 
 
-@dataclass
+@dataclass(slots=True)
 class Cluster:
-    """Represents a detected cluster of methods and fields."""
+    """Represents a detected cluster of methods and fields.
+
+    Slotted: every attribute set on a cluster must be declared as a field here.
+    """
 
     id: int
     member_names: list[str]
@@ -45,6 +49,9 @@ class Cluster:
     quality_tier: QualityTier | None = None
     quality_reasons: list[str] = field(default_factory=list)
 
+    # Design-pattern strategy from the LLM override in extraction validation
+    transformation_strategy: Any | None = None
+
     def __len__(self):
         return len(self.member_names)
 
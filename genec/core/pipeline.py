@@ -3,9 +3,6 @@
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-import sys
-
-import yaml
 
 from genec.core.cluster_detector import ClusterDetector
 from genec.core.dependency_analyzer import ClassDependencies
@@ -33,6 +30,7 @@ from genec.structural import StructuralTransformer, StructuralTransformResult
 from genec.structural.compile_validator import StructuralCompileValidator
 from genec.utils.dependency_manager import DependencyManager
 from genec.utils.logging_utils import get_logger, setup_logger
+from genec.utils.paths import get_project_root
 
 logger = get_logger(__name__)
 
@@ -109,12 +107,8 @@ class GenECPipeline:
         self._initialize_components()
 
     def _get_project_root(self) -> Path:
-        """Get project root directory, handling frozen (PyInstaller) state."""
-        if getattr(sys, "frozen", False):
-            # Running as compiled executable
-            return Path(sys._MEIPASS)
-        # Running as script
-        return Path(__file__).parent.parent.parent
+        """Get project root directory, handling frozen (PyInstaller) and zipapp state."""
+        return get_project_root()
 
     def _apply_overrides(self, config: dict, overrides: dict):
         """Recursively apply configuration overrides."""
@@ -180,14 +174,13 @@ class GenECPipeline:
         ensuring invalid values are caught early rather than causing
         silent misbehavior during evaluation.
         """
-        from genec.config.models import GenECConfig
+        from genec.config.models import load_config
 
         try:
-            with open(config_file) as f:
-                raw = yaml.safe_load(f) or {}
-            # Validate through Pydantic then convert back to dict
-            # so the rest of the pipeline can use dict-style access.
-            validated = GenECConfig(**raw)
+            # Validate through Pydantic (cached per file mtime/size) then
+            # convert back to dict so the rest of the pipeline can use
+            # dict-style access.
+            validated = load_config(config_file)
             return validated.model_dump()
         except FileNotFoundError:
             self.logger.warning(
@@ -680,11 +673,11 @@ class GenECPipeline:
 
         field_usage: dict[str, set[str]] = {m.signature: set() for m in methods}
 
-        for method in methods:
-            body = method.body
-            for field_name in fields:
-                if re.search(rf"\b{re.escape(field_name)}\b", body):
-                    field_usage[method.signature].add(field_name)
+        # One scan of each body finds every field, instead of one search per field
+        if fields:
+            field_re = re.compile(rf"\b({'|'.join(map(re.escape, fields))})\b")
+            for method in methods:
+                field_usage[method.signature].update(field_re.findall(method.body))
 
         field_to_methods: dict[str, set[str]] = {f: set() for f in fields}
         for signature, used_fields in field_usage.items():
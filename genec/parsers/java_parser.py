@@ -3,7 +3,6 @@
 import os
 import re
 from dataclasses import dataclass
-from pathlib import Path
 
 import javalang
 
@@ -13,6 +12,7 @@ except ImportError:  # pragma: no cover - handled gracefully in runtime
     ts_get_parser = None
 
 from genec.utils.logging_utils import get_logger
+from genec.utils.paths import get_project_root
 
 logger = get_logger(__name__)
 
@@ -506,7 +506,7 @@ class JavaParser:
         return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
 
     def _find_jdt_wrapper(self) -> str | None:
-        project_root = Path(__file__).parent.parent.parent
+        project_root = get_project_root()
 
         candidates = [
             # Relative paths (legacy)
@@ -16,11 +16,13 @@ Benefits over javalang:
 
 import json
 import os
+import stat
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
 from genec.utils.logging_utils import get_logger
+from genec.utils.paths import get_project_root
 
 
 @dataclass
@@ -77,7 +79,7 @@ class SpoonParser:
 
     def _find_spoon_wrapper(self) -> str:
         """Find Spoon wrapper JAR in default locations."""
-        project_root = Path(__file__).parent.parent.parent
+        project_root = get_project_root()
 
         possible_locations = [
             # Relative paths (legacy)
@@ -117,11 +119,17 @@ class SpoonParser:
         self.logger.info(f"Analyzing class with Spoon: {class_file}")
 
         # Validate input
+        # A single stat() covers both the existence and regular-file checks
         file_path = Path(class_file)
-        if not file_path.exists():
-            raise SpoonParserError(f"File does not exist: {class_file}")
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
+            raise SpoonParserError(f"File does not exist: {class_file}") from None
+        except OSError as e:
+            # e.g. a path through a regular file (ENOTDIR) or an unreadable directory
+            raise SpoonParserError(f"Cannot access file: {class_file} ({e.strerror})") from None
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise SpoonParserError(f"Path is not a file: {class_file}")
 
         # Build analysis specification
@@ -2,6 +2,13 @@
 
 import logging
 from pathlib import Path
+from typing import TextIO
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Formatters are stateless, so every logger set up with the default format
+# shares this one
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_FORMAT)
 
 
 def setup_logger(
@@ -9,6 +16,7 @@ def setup_logger(
     level: str = "INFO",
     log_file: str | None = None,
     format_string: str | None = None,
+    stream: TextIO | None = None,
 ) -> logging.Logger:
     """
     Set up a logger with console and optional file handlers.
@@ -18,6 +26,7 @@ def setup_logger(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         format_string: Optional custom format string
+        stream: Stream for the console handler (default: sys.stderr)
 
     Returns:
         Configured logger instance
@@ -25,17 +34,19 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
-    logger.handlers = []
+    # Remove existing handlers, closing them so repeated setup (CLI, then the
+    # pipeline) does not leak log file descriptors
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
-    # Default format
     if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    formatter = logging.Formatter(format_string)
+        formatter = _DEFAULT_FORMATTER
+    else:
+        formatter = logging.Formatter(format_string)
 
     # Console handler
-    console_handler = logging.StreamHandler()
+    console_handler = logging.StreamHandler(stream)
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
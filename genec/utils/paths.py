@@ -0,0 +1,48 @@
+"""Locate the GenEC project root (wrapper JARs, lib/ and .env)."""
+
+import os
+import sys
+import zipimport
+from pathlib import Path
+
+# Set this environment variable to the GenEC checkout to override the
+# detected project root, e.g. when running a relocated dist/genec.pyz.
+PROJECT_ROOT_ENV = "GENEC_HOME"
+
+
+def get_zipapp_archive() -> Path | None:
+    """Return the archive GenEC is imported from, or None for an unpacked install."""
+    loader = globals().get("__loader__")
+    if isinstance(loader, zipimport.zipimporter):
+        return Path(loader.archive)
+    return None
+
+
+def get_project_root() -> Path:
+    """
+    Return the directory that holds GenEC's wrapper JARs, lib/ and .env.
+
+    Resolution order:
+    1. ``GENEC_HOME``, if set
+    2. The PyInstaller bundle directory when running frozen
+    3. For a zipapp, the checkout whose ``dist/`` holds the archive, or the
+       archive's own directory when it lives anywhere else
+    4. The source checkout containing the ``genec`` package
+
+    Returns:
+        Project root path
+    """
+    override = os.environ.get(PROJECT_ROOT_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    if getattr(sys, "frozen", False):
+        return Path(sys._MEIPASS)  # type: ignore[attr-defined]
+
+    archive = get_zipapp_archive()
+    if archive is not None:
+        # Path(__file__) points inside the archive, which is not a directory
+        archive_dir = archive.resolve().parent
+        return archive_dir.parent if archive_dir.name == "dist" else archive_dir
+
+    return Path(__file__).parent.parent.parent
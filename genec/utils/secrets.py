@@ -3,6 +3,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from genec.utils.paths import get_project_root
+
 _dotenv_loaded = False
 
 
@@ -14,7 +16,7 @@ def _ensure_dotenv_loaded() -> None:
     _dotenv_loaded = True
 
     # Try project root (works in dev mode)
-    project_root = Path(__file__).parent.parent.parent
+    project_root = get_project_root()
     env_path = project_root / ".env"
     if env_path.exists():
         load_dotenv(env_path, override=True)
@@ -34,6 +36,10 @@ def get_anthropic_api_key() -> str | None:
     1. ANTHROPIC_API_KEY env var (set by CLI arg or system)
     2. .env file (project root or cwd)
 
+    The .env file is read at most once per process; later calls only consult
+    the environment, so a key assigned to ``os.environ`` afterwards (e.g. from
+    ``--api-key``) is picked up without any cache to invalidate.
+
     Returns:
         API key string or None if not found
     """
@@ -0,0 +1,41 @@
+#!/bin/bash
+# Build a self-contained genec.pyz with pre-compiled bytecode
+# Usage: ./scripts/build_zipapp.sh [output]
+#
+# The archive holds only the genec package, compiled with -OO into legacy
+# .pyc files (-b) so imports load bytecode straight from the zip without
+# parsing sources. Third-party dependencies (requirements.txt) must still be
+# installed in the interpreter that runs the archive, and the bytecode is
+# tied to the Python version used to build it.
+#
+# The wrapper JARs, lib/ and .env are not bundled. The archive looks for
+# them in the checkout whose dist/ holds it, or in the archive's own
+# directory once moved elsewhere. GENEC_HOME overrides either location.
+#
+#   ./scripts/build_zipapp.sh
+#   python3 dist/genec.pyz --help
+set -e
+
+ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+PYTHON="${PYTHON:-python3}"
+OUTPUT="${1:-$ROOT/dist/genec.pyz}"
+STAGE="$ROOT/build/zipapp"
+
+echo "=== Building GenEC zipapp ==="
+
+rm -rf "$STAGE"
+mkdir -p "$STAGE" "$(dirname "$OUTPUT")"
+cp -R "$ROOT/genec" "$STAGE/genec"
+find "$STAGE" -name "__pycache__" -type d -prune -exec rm -rf {} +
+
+# Compile next to the sources, then drop the sources themselves
+"$PYTHON" -OO -m compileall -b -q "$STAGE/genec"
+find "$STAGE/genec" -name "*.py" -type f -delete
+
+"$PYTHON" -m zipapp "$STAGE" \
+    -p "/usr/bin/env python3" \
+    -m "genec.cli:main" \
+    -o "$OUTPUT" \
+    --compress
+
+echo "Wrote $OUTPUT"
@@ -1,11 +1,26 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Opt-in native build of hot pure-Python modules (requires Cython). The .py
+# sources stay importable, so default builds remain pure-Python wheels.
+# Cython is deliberately not in [build-system].requires, so build with
+# `pip install --no-build-isolation` from an environment that has it.
+CYTHON_MODULES = ["genec/core/cluster_context_builder.py"]
+
+ext_modules = []
+if os.environ.get("GENEC_CYTHONIZE"):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(CYTHON_MODULES, compiler_directives={"language_level": "3"})
+
 setup(
     name="genec",
     version="1.0.0",
     description="GenEC: Generative Extract Class Refactoring Framework",
     author="GenEC Team",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "javalang==0.13.0",
         "gitpython>=3.1.42",
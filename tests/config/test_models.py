@@ -9,6 +9,10 @@ class TestClusteringConfigValidation:
         with pytest.raises(ValueError, match="algorithm must be one of"):
             ClusteringConfig(algorithm="invalid")
 
+    def test_rejects_invalid_louvain_backend(self):
+        with pytest.raises(ValueError, match="louvain_backend must be one of"):
+            ClusteringConfig(louvain_backend="networkx")
+
     def test_rejects_max_less_than_min(self):
         with pytest.raises(ValueError, match="max_cluster_size"):
             ClusteringConfig(min_cluster_size=10, max_cluster_size=5)
@@ -38,6 +42,19 @@ class TestLLMConfigValidation:
         assert c.provider == "anthropic"
 
 
+class TestSectionImmutability:
+    def test_sections_reject_assignment(self):
+        c = ClusteringConfig()
+        with pytest.raises(ValueError):
+            c.seed = 7
+
+    def test_model_copy_derives_variant(self):
+        c = ClusteringConfig()
+        updated = c.model_copy(update={"seed": 7})
+        assert (c.seed, updated.seed) == (42, 7)
+        assert hash(ClusteringConfig()) == hash(c)
+
+
 class TestFusionDefaults:
     def test_alpha_default_matches_config(self):
         c = FusionConfig()
@@ -52,3 +69,110 @@ class TestClusteringDefaults:
     def test_algorithm_default_is_leiden(self):
         c = ClusteringConfig()
         assert c.algorithm == "leiden"
+
+
+class TestLoadConfigCache:
+    @pytest.fixture
+    def config_file(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GENEC_NO_CONFIG_CACHE", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        path = tmp_path / "config.yaml"
+        path.write_text("clustering:\n  min_cluster_size: 4\n")
+        return path
+
+    def test_second_load_hits_cache(self, config_file, monkeypatch):
+        import genec.config.models as models
+
+        first = models.load_config(str(config_file))
+        assert first.clustering.min_cluster_size == 4
+        assert len(list((config_file.parent / "cache" / "genec").glob("config-*.pkl"))) == 1
+
+        def fail(_path):
+            raise AssertionError("config was re-parsed despite a cache entry")
+
+        monkeypatch.setattr(models, "_parse_config_file", fail)
+        second = models.load_config(str(config_file))
+        assert second.clustering.min_cluster_size == 4
+
+    def test_modified_file_invalidates_cache(self, config_file):
+        import os
+
+        from genec.config.models import load_config
+
+        load_config(str(config_file))
+        config_file.write_text("clustering:\n  min_cluster_size: 5\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(str(config_file)).clustering.min_cluster_size == 5
+
+    def test_modified_file_replaces_its_entry(self, config_file):
+        import os
+
+        from genec.config.models import load_config
+
+        load_config(str(config_file))
+        config_file.write_text("clustering:\n  min_cluster_size: 6\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        load_config(str(config_file))
+
+        assert len(list((config_file.parent / "cache" / "genec").glob("config-*.pkl"))) == 1
+
+    def test_entry_from_other_schema_is_reparsed(self, config_file, monkeypatch):
+        import genec.config.models as models
+
+        models.load_config(str(config_file))
+        monkeypatch.setattr(models, "_schema_fingerprint", lambda: "older-genec")
+        parsed = []
+        parse = models._parse_config_file
+        monkeypatch.setattr(models, "_parse_config_file", lambda p: parsed.append(p) or parse(p))
+
+        assert models.load_config(str(config_file)).clustering.min_cluster_size == 4
+        assert parsed == [config_file]
+
+    def test_env_var_disables_cache(self, config_file, monkeypatch):
+        from genec.config.models import load_config
+
+        monkeypatch.setenv("GENEC_NO_CONFIG_CACHE", "1")
+        load_config(str(config_file))
+        assert not (config_file.parent / "cache").exists()
+
+    def test_missing_file_raises(self, tmp_path):
+        from genec.config.models import load_config
+
+        with pytest.raises(FileNotFoundError):
+            load_config(str(tmp_path / "missing.yaml"))
+
+
+class TestParseConfigFile:
+    def test_partial_file_fills_default_sections(self, tmp_path):
+        from genec.config.models import _parse_config_file
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("clustering:\n  min_cluster_size: 4\n")
+
+        config = _parse_config_file(config_file)
+
+        assert config.clustering.min_cluster_size == 4
+        assert config.llm == LLMConfig()
+        assert config.model_fields_set == {"clustering"}
+
+    def test_non_mapping_document_is_invalid(self, tmp_path):
+        from genec.config.models import _parse_config_file
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("- just\n- a list\n")
+
+        with pytest.raises(ValueError, match="Invalid configuration"):
+            _parse_config_file(config_file)
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        from genec.config.models import _parse_config_file, save_config
+
+        config = GenECConfig.model_validate({"clustering": {"seed": 7}})
+        config_file = tmp_path / "nested" / "config.yaml"
+
+        save_config(config, str(config_file))
+
+        assert _parse_config_file(config_file) == config
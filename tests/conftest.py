@@ -120,6 +120,8 @@ def sample_config():
 def reset_environment():
     """Reset environment variables after each test."""
     original_env = os.environ.copy()
+    # Keep tests from writing parsed configs into the real user cache dir
+    os.environ["GENEC_NO_CONFIG_CACHE"] = "1"
     yield
     os.environ.clear()
     os.environ.update(original_env)
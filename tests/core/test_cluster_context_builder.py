@@ -0,0 +1,169 @@
+"""Tests for the cluster context builder."""
+
+from unittest.mock import patch
+
+import pytest
+
+from genec.core.cluster_context_builder import ClusterContextBuilder
+from genec.core.dependency_analyzer import ClassDependencies, FieldInfo, MethodInfo
+from genec.core.models import Cluster
+
+
+def _method(name, params="", body=None):
+    signature = f"{name}({params})"
+    return MethodInfo(
+        name=name,
+        signature=signature,
+        return_type="void",
+        modifiers=["public"],
+        parameters=[],
+        start_line=1,
+        end_line=3,
+        body=body if body is not None else f"public void {signature} {{\n}}\n",
+    )
+
+
+@pytest.fixture
+def class_deps():
+    """A small class with overloads, a constructor and an empty-bodied method."""
+    return ClassDependencies(
+        class_name="UserManager",
+        package_name="com.example",
+        file_path="UserManager.java",
+        methods=[
+            _method("login", "String"),
+            _method("logout"),
+            _method("audit"),
+            _method("audit", "String"),
+            _method("hash", "String"),
+            _method("stub", body="   "),
+        ],
+        constructors=[_method("UserManager")],
+        fields=[
+            FieldInfo(name="username", type="String", modifiers=["private"], line_number=2),
+            FieldInfo(name="password", type="String", modifiers=[], line_number=3),
+            FieldInfo(name="email", type="String", modifiers=["private"], line_number=4),
+        ],
+        method_calls={
+            "login(String)": ["hash(String)", "audit", "logout()"],
+            "logout()": ["audit(String)"],
+        },
+        field_accesses={
+            "login(String)": ["username", "password"],
+            "logout()": ["username"],
+        },
+    )
+
+
+@pytest.fixture
+def cluster():
+    return Cluster(
+        id=1,
+        member_names=["login(String)", "logout()", "stub()", "username"],
+        member_types={
+            "login(String)": "method",
+            "logout()": "method",
+            "stub()": "method",
+            "username": "field",
+        },
+    )
+
+
+class TestClusterContextBuilder:
+    def test_build_context_layout(self, cluster, class_deps):
+        context = ClusterContextBuilder().build_context(cluster, class_deps)
+
+        assert context == (
+            "// From class: UserManager\n"
+            "// Package: com.example\n"
+            "\n"
+            "// Fields used by this cluster:\n"
+            "private String username;\n"
+            "private String password;\n"
+            "\n"
+            "// Methods in this cluster:\n"
+            "public void login(String) {\n}\n"
+            "\n"
+            "public void logout() {\n}\n"
+            "\n"
+            "// Dependencies (methods called by cluster):\n"
+            "//   - audit()\n"
+            "//   - audit(String)\n"
+            "//   - hash(String)\n"
+            "// Fields not used: email"
+        )
+
+    def test_no_dependencies_and_no_unused_comment(self, class_deps):
+        isolated = Cluster(
+            id=2, member_names=["hash(String)"], member_types={"hash(String)": "method"}
+        )
+        builder = ClusterContextBuilder(include_unused_fields_comment=False)
+
+        context = builder.build_context(isolated, class_deps)
+
+        assert "// Fields used by this cluster:" not in context
+        assert context.endswith("// Dependencies (methods called by cluster): (none)")
+        assert "Fields not used" not in context
+
+    def test_dependencies_exclude_cluster_members(self, cluster, class_deps):
+        deps = ClusterContextBuilder()._get_dependencies(
+            frozenset(cluster.get_methods()), class_deps
+        )
+
+        assert deps == {"audit()", "audit(String)", "hash(String)"}
+
+    def test_sibling_clusters_share_class_deps(self, cluster, class_deps):
+        builder = ClusterContextBuilder()
+        other = Cluster(id=3, member_names=["audit()"], member_types={"audit()": "method"})
+
+        first = builder.build_context(cluster, class_deps)
+        builder.build_context(other, class_deps)
+
+        assert builder.build_context(cluster, class_deps) == first
+
+    def test_partition_fields_keeps_declaration_order(self, cluster, class_deps):
+        used, unused = ClusterContextBuilder()._partition_fields(
+            frozenset(cluster.get_methods()), class_deps
+        )
+
+        assert [f.name for f in used] == ["username", "password"]
+        assert [f.name for f in unused] == ["email"]
+
+    def test_token_savings_skipped_when_info_disabled(self, cluster, class_deps):
+        with patch("genec.core.cluster_context_builder.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+
+            ClusterContextBuilder()._log_token_savings(cluster, class_deps, "context")
+
+        mock_logger.info.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "modifiers,expected",
+        [
+            ([], "private String name;"),
+            (["public", "static", "final"], "public static final String name;"),
+        ],
+    )
+    def test_format_field(self, modifiers, expected):
+        field = FieldInfo(name="name", type="String", modifiers=modifiers, line_number=1)
+
+        assert ClusterContextBuilder()._format_field(field) == expected
+
+    def test_context_reused_for_same_cluster(self, cluster, class_deps):
+        builder = ClusterContextBuilder()
+        first = builder.build_context(cluster, class_deps)
+
+        with patch.object(builder, "_partition_fields") as mock_partition:
+            assert builder.build_context(cluster, class_deps) is first
+        mock_partition.assert_not_called()
+
+    def test_clear_cache_picks_up_in_place_changes(self, cluster, class_deps):
+        builder = ClusterContextBuilder()
+        builder.build_context(cluster, class_deps)
+
+        class_deps.class_name = "AccountManager"
+        builder.clear_cache()
+
+        assert builder.build_context(cluster, class_deps).startswith(
+            "// From class: AccountManager"
+        )
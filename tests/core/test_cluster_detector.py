@@ -92,6 +92,48 @@ class TestClusterDetector:
         for cluster in clusters:
             assert len(cluster.member_names) <= 3  # Respects max_cluster_size=3
 
+    def test_member_types_from_node_attributes(self):
+        """Test member types come from node attributes, defaulting to method."""
+        detector = ClusterDetector(min_cluster_size=1)
+        graph = nx.Graph()
+        graph.add_node("count", type="field")
+        graph.add_edge("count", "inc()", weight=1.0)
+        graph.add_edge("inc()", "dec()", weight=1.0)
+
+        clusters = detector._detect_communities(graph, 1.0)
+
+        member_types = {m: t for c in clusters for m, t in c.member_types.items()}
+        assert member_types == {"count": "field", "inc()": "method", "dec()": "method"}
+
+    def test_disconnected_cluster_split_in_member_order(self):
+        """Test split components keep member order and are numbered by first member."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector()
+        graph = nx.Graph()
+        graph.add_edge("a()", "c()", weight=1.0)
+        graph.add_edge("b()", "d()", weight=0.0)
+        graph.add_edge("c()", "e()", weight=1.0)
+        members = ["b()", "a()", "e()", "d()", "c()"]
+        cluster = Cluster(id=3, member_names=members, member_types=dict.fromkeys(members, "method"))
+
+        subclusters = detector._validate_and_split_connectivity(cluster, graph)
+
+        assert [c.id for c in subclusters] == [3000, 3001]
+        assert [c.member_names for c in subclusters] == [["b()", "d()"], ["a()", "e()", "c()"]]
+        assert all(c.is_connected for c in subclusters)
+
+    def test_connected_cluster_kept_whole(self):
+        """Test a connected cluster is returned unchanged."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector()
+        graph = nx.path_graph(["x()", "y()", "z()"])
+        cluster = Cluster(id=1, member_names=["z()", "x()", "y()"])
+
+        assert detector._validate_and_split_connectivity(cluster, graph) == [cluster]
+        assert cluster.is_connected
+
 
 class TestClusterQuality:
     """Test cluster quality metrics."""
@@ -110,3 +152,564 @@ class TestClusterQuality:
         for cluster in clusters:
             # Cohesion should be between 0 and 1
             assert 0.0 <= cluster.internal_cohesion <= 1.0
+
+    def test_cluster_metrics_from_weight_matrix(self):
+        """Test internal/external averages computed from the CSR weight matrix."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector()
+        graph = nx.Graph()
+        graph.add_edge("a", "b", weight=0.8)
+        graph.add_edge("b", "c", weight=0.4)
+        graph.add_edge("c", "d", weight=0.3)
+        graph.add_edge("a", "e", weight=0.1)
+
+        cluster = Cluster(
+            id=0, member_names=["a", "b", "c"], member_types=dict.fromkeys("abc", "method")
+        )
+        detector._calculate_cluster_metrics(
+            cluster, graph, detector._build_weight_matrix(graph)
+        )
+
+        assert cluster.internal_cohesion == pytest.approx(0.6)
+        assert cluster.external_coupling == pytest.approx(0.2 / 0.6)
+
+    def test_conductance_from_weight_matrix(self):
+        """Test conductance uses cut weight over internal volume."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector()
+        graph = nx.Graph()
+        graph.add_edge("a", "b", weight=0.8)
+        graph.add_edge("b", "c", weight=0.2)
+
+        cluster = Cluster(id=0, member_names=["a", "b"], member_types=dict.fromkeys("ab", "method"))
+
+        assert detector._calculate_conductance(cluster, graph) == pytest.approx(0.2 / 1.6)
+
+    def test_bulk_metrics_match_single_cluster_metrics(self):
+        """Test the one-pass edge tally agrees with scoring clusters one at a time."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector()
+        graph = nx.Graph()
+        graph.add_edge("a", "b", weight=0.9)
+        graph.add_edge("b", "c", weight=0.5)
+        graph.add_edge("c", "d", weight=0.7)
+        graph.add_edge("d", "e", weight=0.6)
+        graph.add_edge("a", "e", weight=0.2)
+
+        def make():
+            return [
+                Cluster(id=0, member_names=["a", "b"], member_types={}),
+                Cluster(id=1, member_names=["c", "d", "e"], member_types={}),
+            ]
+
+        bulk = make()
+        detector._calculate_metrics_for_clusters(bulk, graph)
+        single = make()
+        for cluster in single:
+            detector._calculate_cluster_metrics(cluster, graph)
+
+        for b, s in zip(bulk, single, strict=True):
+            assert b.internal_cohesion == pytest.approx(s.internal_cohesion)
+            assert b.external_coupling == pytest.approx(s.external_coupling)
+        assert bulk[0].internal_cohesion == pytest.approx(0.9)
+        assert bulk[1].external_coupling == pytest.approx(0.35 / 0.65)
+
+    def test_coverage_counts_internal_edges(self):
+        """Test coverage is the share of edges that fall inside clusters."""
+        from genec.core.models import Cluster
+
+        detector = ClusterDetector(config={"clustering": {"quality_metrics": {"coverage": True}}})
+        graph = nx.Graph()
+        graph.add_edge("a", "b", weight=1.0)
+        graph.add_edge("c", "d", weight=1.0)
+        graph.add_edge("b", "c", weight=1.0)
+        clusters = [
+            Cluster(id=0, member_names=["a", "b"], member_types={}),
+            Cluster(id=1, member_names=["c", "d"], member_types={}),
+        ]
+
+        detector._calculate_advanced_metrics(clusters, graph)
+
+        assert [c.coverage for c in clusters] == [pytest.approx(2 / 3)] * 2
+
+
+class TestPatternBasedClusters:
+    """Test naming-pattern fallback clustering for edgeless graphs."""
+
+    def test_groups_by_prefix_and_first_word(self):
+        """Test known prefixes group together and others fall back to the first word."""
+        detector = ClusterDetector(min_cluster_size=2)
+        methods = [
+            "getName()",
+            "getId()",
+            "containsKey(Object)",
+            "containValue(Object)",
+            "containsAll()",
+            "runTask()",
+            "doTask()",
+            "setup()",
+        ]
+
+        clusters = detector._create_pattern_based_clusters(
+            methods, [], dict.fromkeys(methods, "method")
+        )
+
+        groups = sorted(sorted(c.member_names) for c in clusters)
+        assert groups == [
+            ["containsAll()", "containsKey(Object)"],
+            ["doTask()", "runTask()"],
+            ["getId()", "getName()"],
+        ]
+
+    def test_configured_prefixes(self):
+        """Test prefixes from clustering_patterns replace the defaults."""
+        config = {"clustering": {"clustering_patterns": [{"prefix": "load"}]}}
+        detector = ClusterDetector(min_cluster_size=2, config=config)
+        methods = ["loadUser()", "loadRole()", "getUser()"]
+
+        clusters = detector._create_pattern_based_clusters(
+            methods, [], dict.fromkeys(methods, "method")
+        )
+
+        assert [sorted(c.member_names) for c in clusters] == [["loadRole()", "loadUser()"]]
+
+
+class TestLouvainBackends:
+    """Test the Louvain backends agree on the partition contract."""
+
+    @pytest.fixture
+    def graph(self):
+        graph = nx.Graph()
+        for group in ("a", "b"):
+            for i in range(4):
+                for j in range(i + 1, 4):
+                    graph.add_edge(f"{group}{i}", f"{group}{j}", weight=1.0)
+        graph.add_edge("a0", "b0", weight=0.1)
+        return graph
+
+    @pytest.mark.parametrize("use_igraph", [True, False])
+    def test_partition_covers_graph(self, graph, use_igraph):
+        """Test both backends split two cliques joined by a weak edge."""
+        if use_igraph:
+            pytest.importorskip("igraph")
+        detector = ClusterDetector(algorithm="louvain")
+
+        with patch("genec.core.cluster_detector.IGRAPH_AVAILABLE", use_igraph):
+            partition, modularity = detector._detect_communities_louvain(graph, 1.0)
+
+        assert set(partition) == set(graph.nodes())
+        assert len({partition[f"a{i}"] for i in range(4)}) == 1
+        assert partition["a1"] != partition["b1"]
+        assert modularity > 0.4
+
+    def test_igraph_backend_is_seeded(self, graph):
+        """Test the igraph backend is reproducible for a fixed seed."""
+        pytest.importorskip("igraph")
+        detector = ClusterDetector(algorithm="louvain", seed=7)
+
+        first = detector._detect_communities_louvain(graph, 2.0)
+
+        assert detector._detect_communities_louvain(graph, 2.0) == first
+
+    def test_python_louvain_backend_setting(self, graph):
+        """Test python-louvain can be selected even when igraph is installed."""
+        config = {"clustering": {"louvain_backend": "python-louvain"}}
+        detector = ClusterDetector(algorithm="louvain", config=config)
+
+        with patch.object(detector, "_detect_communities_louvain_igraph") as igraph_louvain:
+            partition, _ = detector._detect_communities_louvain(graph, 1.0)
+
+        igraph_louvain.assert_not_called()
+        assert set(partition) == set(graph.nodes())
+        assert not detector._uses_igraph()
+
+
+class TestFilterClusters:
+    """Test cluster filtering."""
+
+    @staticmethod
+    def _cluster(cluster_id, methods, cohesion=1.0):
+        from genec.core.models import Cluster
+
+        members = [f"m{cluster_id}_{i}()" for i in range(methods)]
+        return Cluster(
+            id=cluster_id,
+            member_names=members,
+            member_types=dict.fromkeys(members, "method"),
+            modularity=0.4,
+            internal_cohesion=cohesion,
+        )
+
+    def test_rejects_renames_and_validates_only_survivors(self):
+        """Test near-whole-class and low-cohesion clusters never reach the validator."""
+        detector = ClusterDetector(min_cluster_size=2, max_cluster_size=10, min_cohesion=0.5)
+        class_deps = MagicMock(methods=[MagicMock()] * 10)
+        keep = self._cluster(1, 3)
+        clusters = [keep, self._cluster(2, 8), self._cluster(3, 3, cohesion=0.1)]
+
+        with patch("genec.verification.extraction_validator.ExtractionValidator") as validator_cls:
+            validator_cls.return_value.validate_extraction.return_value = (True, [])
+            filtered = detector.filter_clusters(clusters, class_deps)
+
+        assert filtered == [keep]
+        validator_cls.return_value.validate_extraction.assert_called_once_with(keep, class_deps)
+
+    def test_min_quality_score(self):
+        """Test the optional quality threshold drops weak clusters."""
+        config = {"clustering": {"quality_metrics": {"min_quality_score": 0.99}}}
+        detector = ClusterDetector(min_cluster_size=2, config=config)
+        cluster = self._cluster(1, 3)
+        cluster.quality_score = 0.5
+
+        assert detector.filter_clusters([cluster]) == []
+
+
+class TestRankClusters:
+    """Test cluster ranking."""
+
+    def _clusters(self):
+        from genec.core.models import Cluster
+
+        return [
+            Cluster(id=i, member_names=[f"m{i}()"], internal_cohesion=cohesion)
+            for i, cohesion in enumerate([0.2, 0.9, 0.5, 0.9, 0.1])
+        ]
+
+    def test_top_k_matches_head_of_full_ranking(self):
+        """Test top_k returns the same leading clusters as a full sort."""
+        detector = ClusterDetector()
+
+        full = [c.id for c in detector.rank_clusters(self._clusters())]
+        top = [c.id for c in detector.rank_clusters(self._clusters(), top_k=3)]
+
+        assert top == full[:3]
+        assert full[:2] == [1, 3]
+
+    def test_top_k_scores_every_cluster(self):
+        """Test clusters outside the top_k still receive a rank score."""
+        clusters = self._clusters()
+
+        ClusterDetector().rank_clusters(clusters, top_k=1)
+
+        assert all(c.rank_score is not None for c in clusters)
+
+
+class TestValidateExtractability:
+    """Test extractability checks against the class members."""
+
+    @pytest.fixture
+    def class_deps(self):
+        from genec.core.dependency_analyzer import ClassDependencies, FieldInfo, MethodInfo
+
+        return ClassDependencies(
+            class_name="Account",
+            package_name="com.example",
+            file_path="Account.java",
+            methods=[
+                MethodInfo(
+                    name=name,
+                    signature=f"{name}()",
+                    return_type="void",
+                    modifiers=["public"],
+                    parameters=[],
+                    start_line=1,
+                    end_line=2,
+                    body="",
+                )
+                for name in ("deposit", "withdraw")
+            ],
+            fields=[FieldInfo(name="balance", type="int", modifiers=[], line_number=1)],
+        )
+
+    def _cluster(self, members):
+        from genec.core.models import Cluster
+
+        return Cluster(
+            id=0,
+            member_names=list(members),
+            member_types={m: "field" if "(" not in m else "method" for m in members},
+        )
+
+    def test_unknown_member_is_not_extractable(self, class_deps):
+        """Test clusters naming members outside the class are rejected."""
+        detector = ClusterDetector()
+
+        assert detector.validate_extractability(self._cluster(["deposit()", "balance"]), class_deps)
+        assert not detector.validate_extractability(self._cluster(["close()"]), class_deps)
+        assert not detector.validate_extractability(self._cluster(["owner"]), class_deps)
+
+    def test_class_members_indexed_once_per_class(self, class_deps):
+        """Test the member sets are reused across clusters of the same class."""
+        detector = ClusterDetector()
+
+        with patch.object(
+            class_deps, "get_all_methods", wraps=class_deps.get_all_methods
+        ) as get_all_methods:
+            detector.validate_extractability(self._cluster(["deposit()"]), class_deps)
+            detector.validate_extractability(self._cluster(["withdraw()"]), class_deps)
+
+        get_all_methods.assert_called_once()
+
+
+class TestSemanticAugmentation:
+    """Test hybrid reweighting of structural edges."""
+
+    def test_reinforces_similar_and_weakens_dissimilar_edges(self):
+        """Test similar method pairs are blended and dissimilar ones weakened."""
+        import numpy as np
+
+        detector = ClusterDetector()
+        detector.hybrid_alpha = 0.5
+        detector.semantic_threshold = 0.5
+        detector.semantic_analyzer = MagicMock()
+        detector.semantic_analyzer.extract_class_features.return_value = dict.fromkeys(
+            ["a()", "b()", "c()"]
+        )
+        detector.semantic_analyzer.normalize_features.return_value = np.array(
+            [[0.0, 0.0], [0.0, 0.0], [1.0, 1.0]]
+        )
+        graph = nx.Graph()
+        graph.add_edge("a()", "b()", weight=0.4)
+        graph.add_edge("b()", "c()", weight=0.4)
+        graph.add_edge("c()", "count", weight=0.4)
+
+        augmented = detector._augment_graph_with_semantics(graph, MagicMock())
+
+        assert augmented["a()"]["b()"]["weight"] == pytest.approx(0.5 * 0.4 + 0.5 * 1.0)
+        assert augmented["b()"]["c()"]["weight"] == pytest.approx(0.4 * 0.9)
+        assert augmented["c()"]["count"]["weight"] == 0.4
+        assert graph["a()"]["b()"]["weight"] == 0.4
+
+    def test_no_featured_edges(self):
+        """Test a graph without edges between featured methods is returned uncopied."""
+        import numpy as np
+
+        detector = ClusterDetector()
+        detector.semantic_analyzer = MagicMock()
+        detector.semantic_analyzer.extract_class_features.return_value = dict.fromkeys(["a()"])
+        detector.semantic_analyzer.normalize_features.return_value = np.array([[0.5]])
+        graph = nx.Graph()
+        graph.add_edge("a()", "count", weight=0.4)
+
+        augmented = detector._augment_graph_with_semantics(graph, MagicMock())
+
+        assert augmented is graph
+        assert augmented["a()"]["count"]["weight"] == 0.4
+
+
+class TestGraphDistanceMatrix:
+    """Test graph distances used for silhouette scores."""
+
+    def test_hop_counts_in_requested_order(self):
+        """Test distances are unweighted shortest paths, including zero-weight edges."""
+        graph = nx.Graph()
+        graph.add_edge("a", "b", weight=1.0)
+        graph.add_edge("b", "c", weight=0.0)
+        graph.add_edge("a", "c", weight=0.25)
+        graph.add_edge("c", "d", weight=0.8)
+        nodes = ["d", "a", "b"]
+
+        distances = ClusterDetector()._graph_distance_matrix(nodes, graph)
+
+        expected = [[nx.shortest_path_length(graph, u, v) for v in nodes] for u in nodes]
+        assert distances.tolist() == expected
+
+    def test_unreachable_nodes_are_farthest(self):
+        """Test nodes in other components sit at twice the largest finite distance."""
+        graph = nx.path_graph(["a", "b", "c"])
+        graph.add_edge("x", "y", weight=2)
+
+        distances = ClusterDetector()._graph_distance_matrix(["a", "c", "x"], graph)
+
+        assert distances.tolist() == [[0, 2, 4], [2, 0, 4], [4, 4, 0]]
+
+    def test_silhouette_separates_cliques(self):
+        """Test two loosely joined cliques score a positive silhouette."""
+        pytest.importorskip("sklearn")
+        from genec.core.models import Cluster
+
+        graph = nx.barbell_graph(4, 0)
+        clusters = [
+            Cluster(id=0, member_names=[0, 1, 2, 3]),
+            Cluster(id=1, member_names=[4, 5, 6, 7]),
+        ]
+
+        score = ClusterDetector()._calculate_silhouette_score_for_clustering(clusters, graph)
+
+        assert score > 0.5
+
+
+class TestSilhouetteSampling:
+    """Test silhouette subsampling on large clusterings."""
+
+    def test_small_clusterings_scored_exactly(self):
+        """Test nodes under the sample size are all kept."""
+        nodes, labels = ["a", "b", "c"], [0, 0, 1]
+
+        assert ClusterDetector()._sample_for_silhouette(nodes, labels) == (nodes, labels)
+
+    def test_sample_size_does_not_enable_advanced_metrics(self):
+        """Test the sample size lives outside the quality-metric flags."""
+        config = {
+            "clustering": {
+                "silhouette_sample_size": 10,
+                "quality_metrics": {"silhouette": False, "conductance": False, "coverage": False},
+            }
+        }
+        detector = ClusterDetector(config=config)
+
+        with patch.object(detector, "_calculate_advanced_metrics") as advanced:
+            detector._detect_communities(nx.karate_club_graph(), 1.0)
+
+        assert detector.silhouette_sample_size == 10
+        advanced.assert_not_called()
+
+    def test_sample_keeps_every_cluster(self):
+        """Test a large clustering is sampled in order with every cluster represented."""
+        config = {"clustering": {"silhouette_sample_size": 10}}
+        detector = ClusterDetector(config=config)
+        nodes = [f"n{i}" for i in range(100)]
+        labels = [0] * 90 + list(range(1, 11))
+
+        sampled_nodes, sampled_labels = detector._sample_for_silhouette(nodes, labels)
+
+        assert len(sampled_nodes) == 11
+        assert set(sampled_labels) == set(labels)
+        assert sampled_nodes == sorted(sampled_nodes, key=nodes.index)
+        assert detector._sample_for_silhouette(nodes, labels) == (sampled_nodes, sampled_labels)
+
+
+class TestConsensusClustering:
+    """Test consensus clustering over perturbed runs."""
+
+    def test_stable_cliques_get_full_stability(self):
+        """Test two well-separated cliques co-occur in every run."""
+        config = {"clustering": {"stability_analysis": {"iterations": 4, "threshold": 0.7}}}
+        detector = ClusterDetector(algorithm="louvain", config=config)
+        graph = nx.Graph()
+        for group in ("a", "b"):
+            graph.add_node(f"{group}_field", type="field")
+            members = [f"{group}_field"] + [f"{group}{i}()" for i in range(3)]
+            for i, u in enumerate(members):
+                for v in members[i + 1 :]:
+                    graph.add_edge(u, v, weight=1.0)
+        graph.add_edge("a0()", "b0()", weight=0.05)
+
+        clusters = detector._consensus_clustering(graph)
+
+        assert sorted(sorted(c.member_names) for c in clusters) == [
+            ["a0()", "a1()", "a2()", "a_field"],
+            ["b0()", "b1()", "b2()", "b_field"],
+        ]
+        assert all(c.stability_score == pytest.approx(1.0) for c in clusters)
+        member_types = {m: t for c in clusters for m, t in c.member_types.items()}
+        assert member_types["a_field"] == member_types["b_field"] == "field"
+
+    @pytest.mark.parametrize("algorithm", ["leiden", "louvain"])
+    def test_seeded_runs_repeat_and_leave_graph_untouched(self, algorithm):
+        """Test seeded consensus is reproducible and never mutates the input graph."""
+        pytest.importorskip("igraph")
+        config = {"clustering": {"stability_analysis": {"iterations": 5, "threshold": 0.5}}}
+        graph = nx.les_miserables_graph()
+        before = {(u, v): w for u, v, w in graph.edges(data="weight")}
+
+        runs = [
+            ClusterDetector(algorithm=algorithm, config=config, seed=7)._consensus_clustering(graph)
+            for _ in range(2)
+        ]
+
+        first, second = ([(c.member_names, c.stability_score) for c in run] for run in runs)
+        assert first == second
+        assert {(u, v): w for u, v, w in graph.edges(data="weight")} == before
+
+    def test_parallel_runs_match_serial(self):
+        """Test consensus over worker processes matches the serial result."""
+        config = {"clustering": {"stability_analysis": {"iterations": 4, "threshold": 0.5}}}
+        graph = nx.les_miserables_graph()
+        serial = ClusterDetector(config=config)._consensus_clustering(graph)
+
+        config["clustering"]["stability_analysis"].update(parallel=True, max_workers=2)
+        parallel = ClusterDetector(config=config)._consensus_clustering(graph)
+
+        assert [(c.member_names, c.stability_score) for c in parallel] == [
+            (c.member_names, c.stability_score) for c in serial
+        ]
+
+
+class TestMultiResolution:
+    """Test multi-resolution sweeps."""
+
+    def test_graph_converted_once_per_sweep(self):
+        """Test the igraph copy and weight matrix are shared across resolutions."""
+        pytest.importorskip("igraph")
+        config = {
+            "clustering": {
+                "multi_resolution": {
+                    "resolution_range": [0.5, 1.0, 1.5],
+                    "quality_metric": "modularity",
+                }
+            }
+        }
+        detector = ClusterDetector(config=config)
+        graph = nx.karate_club_graph()
+
+        with patch.object(
+            detector, "_networkx_to_igraph", wraps=detector._networkx_to_igraph
+        ) as to_igraph, patch.object(
+            detector, "_build_weight_matrix", wraps=detector._build_weight_matrix
+        ) as build_matrix:
+            clusters = detector._multi_resolution_clustering(graph)
+
+        assert clusters
+        to_igraph.assert_called_once()
+        build_matrix.assert_called_once()
+
+    def test_silhouette_distances_computed_once_per_sweep(self):
+        """Test one distance matrix scores every resolution, as if built per clustering."""
+        pytest.importorskip("sklearn")
+        config = {"clustering": {"multi_resolution": {"resolution_range": [0.5, 1.0, 1.5]}}}
+        detector = ClusterDetector(min_cluster_size=1, config=config)
+        graph = nx.karate_club_graph()
+
+        with patch.object(
+            detector, "_graph_distance_matrix", wraps=detector._graph_distance_matrix
+        ) as distance_matrix, patch.object(
+            detector,
+            "_calculate_silhouette_score_for_clustering",
+            wraps=detector._calculate_silhouette_score_for_clustering,
+        ) as score:
+            detector._multi_resolution_clustering(graph)
+
+        distance_matrix.assert_called_once()
+        assert score.call_args_list
+        for call in score.call_args_list:
+            clusters, G, adjacency, distances = call.args
+            assert distances is not None
+            cached = detector._calculate_silhouette_score_for_clustering(
+                clusters, G, adjacency, distances
+            )
+            assert cached == pytest.approx(
+                detector._calculate_silhouette_score_for_clustering(clusters, G, adjacency)
+            )
+
+    def test_parallel_sweep_matches_serial(self):
+        """Test worker processes pick the same clustering as the serial sweep."""
+        config = {
+            "clustering": {
+                "multi_resolution": {
+                    "resolution_range": [0.5, 1.0, 1.5],
+                    "quality_metric": "modularity",
+                }
+            }
+        }
+        graph = nx.karate_club_graph()
+        serial = ClusterDetector(config=config)._multi_resolution_clustering(graph)
+
+        config["clustering"]["multi_resolution"].update(parallel=True, max_workers=2)
+        parallel = ClusterDetector(config=config)._multi_resolution_clustering(graph)
+
+        assert [c.member_names for c in parallel] == [c.member_names for c in serial]
+        assert [c.modularity for c in parallel] == [c.modularity for c in serial]
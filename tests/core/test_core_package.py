@@ -0,0 +1,32 @@
+"""Tests for lazy attribute loading in the genec.core package."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestCorePackageExports:
+    def test_model_import_does_not_load_pipeline(self):
+        code = (
+            "import sys; from genec.core import Cluster; "
+            "mods = ('genec.core.pipeline', 'genec.core.cluster_detector', 'networkx'); "
+            "print(','.join(m for m in mods if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_all_exports_resolve(self):
+        import genec.core
+
+        for name in genec.core.__all__:
+            assert getattr(genec.core, name).__name__ == name
+        assert set(genec.core.__all__) <= set(dir(genec.core))
+
+    def test_unknown_attribute_raises(self):
+        import genec.core
+
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = genec.core.Missing
@@ -12,6 +12,7 @@ from genec.core.dependency_analyzer import (
     WEIGHT_METHOD_CALL,
     WEIGHT_SHARED_FIELD,
     build_dependency_matrix,
+    read_java_source,
 )
 
 
@@ -297,3 +298,41 @@ class TestModuleLevelConstants:
         assert WEIGHT_METHOD_CALL == 1.0
         assert WEIGHT_FIELD_ACCESS == 0.8
         assert WEIGHT_SHARED_FIELD == 0.9
+
+
+class TestReadJavaSource:
+    """Tests for read_java_source (buffered and memory-mapped paths)."""
+
+    def test_small_file_normalises_newlines(self, tmp_path):
+        java_file = tmp_path / "Small.java"
+        java_file.write_bytes(b"class Small {\r\n  int a;\r}\n")
+
+        assert read_java_source(str(java_file)) == "class Small {\n  int a;\n}\n"
+
+    def test_large_file_is_memory_mapped(self, tmp_path, monkeypatch):
+        import genec.core.dependency_analyzer as module
+
+        monkeypatch.setattr(module, "MMAP_THRESHOLD_BYTES", 16)
+        java_file = tmp_path / "Large.java"
+        java_file.write_bytes("class Large {\r\n  String s = \"é\";\r\n}\r\n".encode())
+
+        assert read_java_source(str(java_file)) == 'class Large {\n  String s = "é";\n}\n'
+
+    def test_analyze_class_reads_large_file(self, tmp_path, monkeypatch):
+        import genec.core.dependency_analyzer as module
+
+        monkeypatch.setattr(module, "MMAP_THRESHOLD_BYTES", 16)
+        java_file = tmp_path / "Sample.java"
+        java_file.write_text(
+            "package com.example;\n"
+            "public class Sample {\n"
+            "    private int count;\n"
+            "    public void inc() { count++; }\n"
+            "}\n"
+        )
+
+        deps = DependencyAnalyzer().analyze_class(str(java_file))
+
+        assert deps is not None
+        assert deps.class_name == "Sample"
+        assert [f.name for f in deps.fields] == ["count"]
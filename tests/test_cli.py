@@ -1,5 +1,6 @@
 """Tests for the CLI module."""
 
+import copy
 import json
 import os
 import sys
@@ -37,7 +38,7 @@ class TestCLIArguments:
         parser = create_parser()
         args = parser.parse_args(["--target", str(sample_java_file), "--repo", str(sample_java_file.parent)])
 
-        assert args.target == str(sample_java_file)
+        assert args.target == sample_java_file.resolve()
 
     def test_json_output_flag(self, sample_java_file):
         """Test --json flag."""
@@ -67,6 +68,122 @@ class TestCLIArguments:
         assert args.max_cluster_size == 20
         assert args.min_cohesion == 0.5
 
+    @pytest.mark.parametrize(
+        "flags,level",
+        [
+            ([], "INFO"),
+            (["--json"], "INFO"),
+            (["--quiet"], "WARNING"),
+            (["--quiet", "--verbose"], "DEBUG"),
+        ],
+    )
+    def test_log_level_flags(self, flags, level):
+        """--quiet drops INFO logging; --verbose takes precedence."""
+        import logging
+
+        from genec.cli import _setup_logging, create_parser
+
+        args = create_parser().parse_args(["--target", "A.java", "--repo", "."] + flags)
+        logger = _setup_logging(args)
+
+        assert logger.level == getattr(logging, level)
+
+    def test_parser_is_cached(self):
+        """main() reuses one parser, and reuse does not leak state between parses."""
+        from genec.cli import _get_parser
+
+        parser = _get_parser()
+        assert _get_parser() is parser
+
+        first = parser.parse_args(["--target", "A.java", "--repo", ".", "--seed", "3"])
+        second = parser.parse_args(["--target", "B.java", "--repo", "."])
+        assert first.seed == 3
+        assert second.seed is None
+
+
+class TestConfigOverrides:
+    """Test mapping of CLI arguments onto pipeline config overrides."""
+
+    def _overrides(self, *extra):
+        from genec.cli import _build_config_overrides, create_parser
+
+        args = create_parser().parse_args(["--target", "A.java", "--repo", "."] + list(extra))
+        return _build_config_overrides(args)
+
+    def test_no_arguments_no_overrides(self):
+        """Defaults produce no overrides."""
+        assert self._overrides() == {}
+
+    def test_dry_run_wins_over_apply_all(self):
+        """--dry-run keeps dry_run enabled even with --apply-all."""
+        overrides = self._overrides("--apply-all", "--dry-run", "--seed", "7", "--no-build")
+
+        assert overrides["refactoring_application"] == {
+            "enabled": True,
+            "auto_apply": True,
+            "dry_run": True,
+        }
+        assert overrides["clustering"] == {"seed": 7}
+        assert overrides["auto_build_dependencies"] is False
+
+
+class TestCLIImports:
+    """Test that importing the CLI stays lightweight."""
+
+    def test_import_does_not_load_pipeline(self):
+        """`import genec.cli` must not import the pipeline or dotenv."""
+        import subprocess
+
+        code = (
+            "import sys, genec.cli; "
+            "heavy = [m for m in ('genec.core.pipeline', 'dotenv') if m in sys.modules]; "
+            "print(','.join(heavy))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_import_does_not_load_progress_server(self):
+        """The WebSocket server and its dependencies load only for --websocket."""
+        import subprocess
+
+        code = (
+            "import sys, genec.cli; "
+            "mods = ('genec.utils.progress_server', 'websockets', 'asyncio'); "
+            "print(','.join(m for m in mods if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_package_exposes_pipeline_lazily(self):
+        """`genec.GenECPipeline` still resolves on attribute access."""
+        import genec
+        from genec.core.pipeline import GenECPipeline
+
+        assert genec.GenECPipeline is GenECPipeline
+
+    def test_version_skips_signal_and_dotenv(self, monkeypatch):
+        """`--version` exits before signal handlers or .env loading."""
+        import signal
+
+        import dotenv
+
+        from genec import cli
+
+        calls = []
+        monkeypatch.setattr(signal, "signal", lambda *a: calls.append("signal"))
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda *a, **k: calls.append("dotenv"))
+        monkeypatch.setattr(sys, "argv", ["genec", "--version"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        assert exc_info.value.code == 0
+        assert calls == []
+
 
 class TestCLIValidation:
     """Test CLI input validation."""
@@ -80,6 +197,15 @@ class TestCLIValidation:
         with pytest.raises(FileNotFoundError):
             validate_target_file(str(nonexistent))
 
+    def test_target_under_regular_file(self, sample_java_file):
+        """A path that runs through a regular file is reported as a missing target."""
+        from genec.cli import validate_target_file
+
+        bad = sample_java_file / "Nested.java"
+
+        with pytest.raises(FileNotFoundError, match="Nested.java"):
+            validate_target_file(str(bad))
+
     def test_non_java_file(self, temp_dir):
         """Test error handling for non-Java file."""
         from genec.cli import validate_target_file
@@ -99,6 +225,39 @@ class TestCLIValidation:
         assert result is not None  # Should return a valid path for valid Java files
 
 
+class TestCLICleanup:
+    """Test cleanup of the generated.java artifact after a run."""
+
+    def _run_main(self, monkeypatch, java_file):
+        from genec import cli
+
+        monkeypatch.setattr("signal.signal", lambda *a: None)
+        monkeypatch.setattr(cli, "_run_pipeline", lambda *a: (MagicMock(), "0.1s"))
+        monkeypatch.setattr(cli, "_format_text_output", lambda *a: None)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["genec", "--target", str(java_file), "--repo", str(java_file.parent),
+             "--api-key", "sk-ant-0123456789"],
+        )
+        cli.main()
+
+    def test_removes_generated_artifact(self, monkeypatch, sample_java_file):
+        """A leftover generated.java next to the target is deleted."""
+        artifact = sample_java_file.parent / "generated.java"
+        artifact.write_text("class Generated {}")
+
+        self._run_main(monkeypatch, sample_java_file)
+
+        assert not artifact.exists()
+
+    def test_missing_artifact_is_not_an_error(self, monkeypatch, sample_java_file):
+        """No generated.java is the normal case and passes silently."""
+        self._run_main(monkeypatch, sample_java_file)
+
+        assert not (sample_java_file.parent / "generated.java").exists()
+
+
 class TestCLIEnvironment:
     """Test CLI environment handling."""
 
@@ -125,6 +284,31 @@ class TestCLIEnvironment:
         key = get_anthropic_api_key()
         assert key is None
 
+    def test_dotenv_read_once(self, monkeypatch, temp_dir):
+        """Repeated lookups parse .env once but still see later env changes."""
+        import genec.utils.secrets as secrets_mod
+
+        (temp_dir / ".env").write_text("UNRELATED=1\n")
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(secrets_mod, "_dotenv_loaded", False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        with patch.object(secrets_mod, "load_dotenv") as mock_load:
+            assert secrets_mod.get_anthropic_api_key() is None
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-later-key")
+            assert secrets_mod.get_anthropic_api_key() == "sk-ant-later-key"
+
+        assert mock_load.call_count == 1
+
+    def test_explicit_api_key_skips_lookup(self):
+        """An explicitly passed key is validated without consulting secrets."""
+        from genec.cli import validate_api_key_for_llm_features
+
+        with patch("genec.utils.secrets.get_anthropic_api_key") as mock_lookup:
+            assert validate_api_key_for_llm_features("sk-ant-0123456789") is True
+            assert validate_api_key_for_llm_features("short") is False
+            mock_lookup.assert_not_called()
+
 
 class TestCLIOutput:
     """Test CLI output formats."""
@@ -153,3 +337,84 @@ class TestCLIOutput:
         parsed = json.loads(json_str)
         assert parsed["status"] == "error"
         assert "error" in parsed
+
+    @staticmethod
+    def _sample_results():
+        from genec.core.models import Cluster, RefactoringSuggestion
+        from genec.core.pipeline import PipelineResult
+
+        cluster = Cluster(id=0, member_names=["a", "x"], member_types={"a": "method", "x": "field"})
+        suggestion = RefactoringSuggestion(
+            cluster_id=0,
+            proposed_class_name="Extracted",
+            rationale="cohesive",
+            new_class_code="class Extracted {}",
+            modified_original_code="class Original {}",
+            cluster=cluster,
+            verification_status="verified",
+        )
+        return PipelineResult(
+            class_name="Original", suggestions=[suggestion], verified_suggestions=[suggestion]
+        )
+
+    def test_write_json_output_writes_payload(self):
+        """_write_json_output writes one newline-terminated JSON document."""
+        import io
+
+        from genec.cli import _write_json_output
+
+        buf = io.StringIO()
+        _write_json_output(self._sample_results(), "1.0s", stream=buf)
+
+        assert buf.getvalue().endswith("}\n")
+        parsed = json.loads(buf.getvalue())
+        assert parsed["status"] == "success"
+        assert parsed["runtime"] == "1.0s"
+        assert parsed["suggestions"][0]["name"] == "Extracted"
+        assert parsed["suggestions"][0]["verified"] is True
+        assert parsed["suggestions"][0]["methods"] == ["a"]
+
+    def test_write_json_output_writes_nothing_on_unserializable_value(self):
+        """An unserializable value raises before any partial JSON is written."""
+        import io
+
+        from genec.cli import _write_json_output
+
+        buf = io.StringIO()
+        with patch("genec.cli._build_json_output", return_value={"a": 1, "b": object()}):
+            with pytest.raises(TypeError):
+                _write_json_output(self._sample_results(), "1.0s", stream=buf)
+
+        assert buf.getvalue() == ""
+
+    def test_write_json_output_orjson_matches_stdlib(self):
+        """The orjson fast path emits the same document as the stdlib encoder."""
+        import io
+
+        pytest.importorskip("orjson")
+        from genec.cli import _write_json_output
+
+        results = self._sample_results()
+        text_buf = io.StringIO()
+        _write_json_output(results, "1.0s", stream=text_buf)
+
+        raw = io.BytesIO()
+        binary_stream = io.TextIOWrapper(raw, encoding="utf-8")
+        _write_json_output(results, "1.0s", stream=binary_stream)
+
+        assert raw.getvalue().endswith(b"\n")
+        assert json.loads(raw.getvalue()) == json.loads(text_buf.getvalue())
+
+    def test_json_verified_flag_follows_verified_suggestions(self):
+        """Suggestions verified after repair are reported as verified too."""
+        from genec.cli import _build_json_output
+
+        results = self._sample_results()
+        repaired, failed = copy.copy(results.suggestions[0]), copy.copy(results.suggestions[0])
+        repaired.verification_status = "verified_after_repair"
+        failed.verification_status = "failed"
+        results.suggestions += [repaired, failed]
+        results.verified_suggestions.append(repaired)
+
+        flags = [s["verified"] for s in _build_json_output(results, "1.0s")["suggestions"]]
+        assert flags == [True, True, False]
@@ -0,0 +1,37 @@
+import io
+import logging
+
+from genec.utils.logging_utils import setup_logger
+
+
+class TestSetupLogger:
+    def test_console_handler_uses_given_stream(self):
+        buf = io.StringIO()
+        logger = setup_logger("genec.test.stream", level="INFO", stream=buf)
+
+        logger.info("hello")
+
+        assert "hello" in buf.getvalue()
+        assert len(logger.handlers) == 1
+
+    def test_repeated_setup_replaces_handlers(self):
+        setup_logger("genec.test.repeat", stream=io.StringIO())
+        logger = setup_logger("genec.test.repeat", level="DEBUG", stream=io.StringIO())
+
+        assert len(logger.handlers) == 1
+        assert logger.level == logging.DEBUG
+
+    def test_repeated_setup_closes_file_handler(self, tmp_path):
+        log_file = tmp_path / "logs" / "genec.log"
+        first = setup_logger("genec.test.file", log_file=str(log_file), stream=io.StringIO())
+        file_handler = next(h for h in first.handlers if isinstance(h, logging.FileHandler))
+
+        setup_logger("genec.test.file", stream=io.StringIO())
+
+        assert file_handler.stream is None
+
+    def test_default_formatter_is_shared(self):
+        a = setup_logger("genec.test.fmt_a", stream=io.StringIO())
+        b = setup_logger("genec.test.fmt_b", stream=io.StringIO())
+
+        assert a.handlers[0].formatter is b.handlers[0].formatter
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import genec.utils.paths as paths
+from genec.utils.paths import PROJECT_ROOT_ENV, get_project_root
+
+
+class TestGetProjectRoot:
+    def test_source_checkout(self, monkeypatch):
+        monkeypatch.delenv(PROJECT_ROOT_ENV, raising=False)
+
+        assert get_project_root() == Path(paths.__file__).parent.parent.parent
+        assert (get_project_root() / "genec" / "utils" / "paths.py").is_file()
+
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(PROJECT_ROOT_ENV, str(tmp_path))
+        monkeypatch.setattr(sys, "frozen", True, raising=False)
+
+        assert get_project_root() == tmp_path
+
+    def test_zipapp_in_dist_uses_checkout(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(PROJECT_ROOT_ENV, raising=False)
+        archive = tmp_path / "dist" / "genec.pyz"
+        archive.parent.mkdir()
+        archive.touch()
+        monkeypatch.setattr(paths, "get_zipapp_archive", lambda: archive)
+
+        assert get_project_root() == tmp_path.resolve()
+
+    def test_relocated_zipapp_uses_its_directory(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(PROJECT_ROOT_ENV, raising=False)
+        archive = tmp_path / "genec.pyz"
+        archive.touch()
+        monkeypatch.setattr(paths, "get_zipapp_archive", lambda: archive)
+
+        assert get_project_root() == tmp_path.resolve()